@@ -44,6 +44,8 @@ class AppState:
         self.browser_connected = False
         self.logged_in = False
         self.last_operation: Optional[dict] = None
+        # Id of the operation currently driving the browser, if any
+        self.browser_operation: Optional[str] = None
 
 
 state = AppState()
@@ -115,6 +117,18 @@ async def broadcast(message: dict):
         state.websocket_clients.remove(ws)
 
 
+def require_browser_idle():
+    """Reject the request while a background operation is using the browser.
+    
+    The WebDriver session is shared and not safe for concurrent use.
+    """
+    if state.browser_operation is not None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Browser busy with operation {state.browser_operation}",
+        )
+
+
 # Lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -160,6 +174,7 @@ async def get_status():
 @app.post("/api/auth/login", response_model=LoginResponse)
 async def login(request: LoginRequest):
     """Start browser and login to Instagram."""
+    require_browser_idle()
     try:
         if state.browser is None:
             state.browser = BrowserManager(config=state.config)
@@ -196,6 +211,7 @@ async def verify_login():
     """Verify login and auto-detect username using multiple strategies."""
     if state.browser is None or state.browser.driver is None:
         raise HTTPException(status_code=400, detail="Browser not started")
+    require_browser_idle()
     
     try:
         driver = state.browser.driver
@@ -357,6 +373,7 @@ async def verify_login():
 @app.post("/api/auth/logout")
 async def logout():
     """Close browser and logout."""
+    require_browser_idle()
     if state.browser:
         state.browser.close()
         state.browser = None
@@ -371,6 +388,7 @@ async def start_compare():
     """Start a compare operation (scrape and compare snapshots)."""
     if not state.logged_in or state.browser is None:
         raise HTTPException(status_code=400, detail="Not logged in")
+    require_browser_idle()
     
     operation_id = str(uuid.uuid4())
     state.active_operations[operation_id] = {
@@ -381,7 +399,8 @@ async def start_compare():
         "message": "Starting comparison...",
     }
     
-    # Run in background
+    # Run in background; the task releases the browser when it finishes
+    state.browser_operation = operation_id
     asyncio.create_task(run_compare_operation(operation_id))
     
     return OperationResponse(operation_id=operation_id, status="started")
@@ -506,6 +525,8 @@ async def run_compare_operation(operation_id: str):
             "operation_id": operation_id,
             "error": str(e),
         })
+    finally:
+        state.browser_operation = None
 
 
 @app.get("/api/compare/{operation_id}")
@@ -521,6 +542,7 @@ async def start_unfollow(request: UnfollowRequest):
     """Start an unfollow operation."""
     if not state.logged_in or state.browser is None:
         raise HTTPException(status_code=400, detail="Not logged in")
+    require_browser_idle()
     
     operation_id = str(uuid.uuid4())
     state.active_operations[operation_id] = {
@@ -532,7 +554,8 @@ async def start_unfollow(request: UnfollowRequest):
         "dry_run": request.dry_run,
     }
     
-    # Run in background
+    # Run in background; the task releases the browser when it finishes
+    state.browser_operation = operation_id
     asyncio.create_task(run_unfollow_operation(
         operation_id, request.targets, request.dry_run, request.max_unfollows
     ))
@@ -560,7 +583,7 @@ async def run_unfollow_operation(
         )
         
         # Execute unfollows
-        result = executor.execute(targets, max_unfollows)
+        result = await executor.execute_async(targets, max_unfollows)
         
         op["status"] = "completed"
         op["message"] = f"Unfollowed {len(result.successful)} users"
@@ -642,6 +665,8 @@ async def run_unfollow_operation(
             "operation_id": operation_id,
             "error": str(e),
         })
+    finally:
+        state.browser_operation = None
 
 
 @app.get("/api/unfollow/{operation_id}")
@@ -736,7 +761,8 @@ async def remove_from_skip_list(username: str):
 @app.get("/api/history")
 async def get_history():
     """Get unfollow history."""
-    history = state.history_manager.load()
+    # Copied because unfollow threads may add entries while it is encoded
+    history = dict(state.history_manager.load())
     return {"unfollowed": history}
 
 
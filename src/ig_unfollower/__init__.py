@@ -2,11 +2,12 @@
 
 __version__ = "0.1.0"
 
-from .browser import BrowserManager, retry_with_backoff, retry_operation
+from .browser import BrowserManager, WebDriverPool, retry_with_backoff, retry_operation
 from .config import Config, ConfigManager
 
 __all__ = [
     "BrowserManager",
+    "WebDriverPool",
     "retry_with_backoff",
     "retry_operation",
     "Config",
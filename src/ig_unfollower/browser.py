@@ -1,8 +1,11 @@
 """Browser management module for Chrome automation."""
 
 import os
+import queue
+import threading
 import time
-from typing import Callable, TypeVar
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -31,19 +34,38 @@ class BrowserManager:
     INSTAGRAM_URL = "https://www.instagram.com"
     LOGIN_URL = "https://www.instagram.com/accounts/login/"
     
-    def __init__(self, profile_path: str | None = None, config: Config | None = None):
+    # Media that is never needed for scraping usernames
+    BLOCKED_RESOURCE_PATTERNS = [
+        "*.jpg", "*.jpeg", "*.png", "*.webp", "*.mp4", "*.m4s", "*.mp3",
+    ]
+    
+    def __init__(
+        self,
+        profile_path: str | None = None,
+        config: Config | None = None,
+        ephemeral: bool = False,
+    ):
         """Initialize browser with Chrome profile for session reuse.
         
         Args:
             profile_path: Path to Chrome profile directory. If None, uses config default.
             config: Configuration object. If None, loads from default config file.
+            ephemeral: If True, start with a fresh temporary profile instead.
+                Needed for a second concurrent browser, since Chrome locks
+                a profile directory to one process.
         """
         if config is None:
             config = ConfigManager().load()
         
         self.config = config
-        self.profile_path = profile_path or os.path.expanduser(config.chrome_profile_path)
+        if ephemeral:
+            self.profile_path = None
+        else:
+            self.profile_path = profile_path or os.path.expanduser(config.chrome_profile_path)
         self.driver: webdriver.Chrome | None = None
+        self._media_blocked = False
+        # Scripts registered for every new document: name -> CDP identifier
+        self._page_scripts: dict[str, str] = {}
     
     def start(self) -> webdriver.Chrome:
         """Launch Chrome browser in non-headless mode and return driver instance.
@@ -76,8 +98,101 @@ class BrowserManager:
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
         
+        self._media_blocked = False
+        self._page_scripts = {}
+        
         return self.driver
 
+    def block_media_resources(self) -> bool:
+        """Block image, video, and audio requests via CDP.
+        
+        Avatars and thumbnails dominate the bytes transferred while scrolling
+        follower lists. Blocking them lets rows attach to the DOM sooner.
+        The block lasts for the lifetime of the driver session.
+        
+        Returns:
+            True if the block is active, False if CDP is unavailable.
+        """
+        if self.driver is None:
+            raise WebDriverException("Browser not started")
+        
+        if self._media_blocked:
+            return True
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": self.BLOCKED_RESOURCE_PATTERNS}
+            )
+            self._media_blocked = True
+        except WebDriverException:
+            return False
+        
+        return True
+
+    def add_page_script(self, name: str, source: str) -> bool:
+        """Run a script on every new document, registering it once per session.
+        
+        Several callers can share one browser; keying the registration by
+        name keeps the same script from being injected more than once.
+        Only pages loaded afterwards run it.
+        
+        Args:
+            name: Key identifying the script.
+            source: JavaScript source to evaluate before page scripts.
+        
+        Returns:
+            True if the script is registered, False if CDP is unavailable.
+        """
+        if self.driver is None:
+            raise WebDriverException("Browser not started")
+        
+        if name in self._page_scripts:
+            return True
+        
+        try:
+            added = self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": source}
+            )
+        except WebDriverException:
+            return False
+        
+        self._page_scripts[name] = added.get("identifier", "")
+        return True
+
+    def has_page_script(self, name: str) -> bool:
+        """Check whether a script was registered with add_page_script.
+        
+        Args:
+            name: Key the script was registered under.
+            
+        Returns:
+            True if the script runs on new documents in this session.
+        """
+        return name in self._page_scripts
+
+    def copy_session_from(self, other: "BrowserManager") -> None:
+        """Copy Instagram session cookies from another running browser.
+        
+        Lets an ephemeral browser reuse an existing login without going
+        through the login flow again.
+        
+        Args:
+            other: Logged-in browser whose cookies are copied.
+        """
+        if self.driver is None or other.driver is None:
+            raise WebDriverException("Browser not started")
+        
+        cookies = other.driver.get_cookies()
+        
+        # add_cookie only accepts cookies for the currently loaded domain
+        self.driver.get(self.INSTAGRAM_URL)
+        for cookie in cookies:
+            if cookie.get("domain", "").endswith("instagram.com"):
+                self.driver.add_cookie(cookie)
+
     def is_logged_in(self) -> bool:
         """Check if Instagram session is active.
         
@@ -159,6 +274,8 @@ class BrowserManager:
                 pass  # Browser may already be closed
             finally:
                 self.driver = None
+                self._media_blocked = False
+                self._page_scripts = {}
 
     
     def login(self, username: str | None = None, password: str | None = None, manual: bool = False) -> bool:
@@ -393,6 +510,171 @@ class BrowserManager:
         return False
 
 
+class WebDriverPool:
+    """Keeps warm browser sessions around so batch scrapes skip Chrome startup.
+
+    Browsers are started lazily on first checkout and reused afterwards.
+    Launching Chrome and completing the driver handshake costs roughly 1-3s,
+    which dominates short scrapes when many run back to back.
+
+    Pooled browsers use fresh temporary profiles, since Chrome locks the
+    configured profile directory to one process, and take their login from
+    session_source.
+
+    Example:
+        pool = WebDriverPool(size=2, config=config, session_source=browser)
+        with pool.browser() as browser:
+            scraper = InstagramScraper(browser, username, config)
+            ...
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        config: Config | None = None,
+        clear_cookies_on_release: bool = False,
+        session_source: BrowserManager | None = None,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            size: Maximum number of browsers the pool will start.
+            config: Configuration passed to each BrowserManager.
+            clear_cookies_on_release: If True, wipe cookies via CDP when a
+                browser is checked back in. Off by default because the
+                Instagram session itself lives in cookies.
+            session_source: Logged-in browser whose cookies are copied into
+                each pooled browser when it starts. Without one, pooled
+                browsers start logged out.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.size = size
+        self.config = config or ConfigManager().load()
+        self.clear_cookies_on_release = clear_cookies_on_release
+        self.session_source = session_source
+        # None entries wake a waiter after a failed launch frees a slot
+        self._idle: queue.Queue[BrowserManager | None] = queue.Queue()
+        self._all: list[BrowserManager] = []
+        self._starting = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> BrowserManager:
+        """Check out a started browser, launching one if the pool has room.
+
+        Args:
+            timeout: Seconds to wait for a browser when all are in use.
+                Waits indefinitely if None.
+
+        Returns:
+            A BrowserManager with a running driver.
+
+        Raises:
+            queue.Empty: If no browser became available within timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_start = len(self._all) + self._starting < self.size
+                    if can_start:
+                        self._starting += 1
+                if can_start:
+                    return self._start_new()
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                browser = self._idle.get(timeout=remaining)
+
+            if browser is None:
+                continue  # A slot was freed; try to claim it
+            if browser.driver is None:
+                # Closed on release; a failed restart gives up its slot
+                try:
+                    self._launch(browser)
+                except Exception:
+                    with self._lock:
+                        self._all.remove(browser)
+                    self._idle.put(None)
+                    raise
+            return browser
+
+    def _start_new(self) -> BrowserManager:
+        """Launch a browser into a slot reserved by acquire().
+
+        The browser is only registered once it is running, so a failed
+        launch frees the slot instead of leaking it.
+
+        Returns:
+            The started BrowserManager.
+        """
+        browser = BrowserManager(config=self.config, ephemeral=True)
+        try:
+            self._launch(browser)
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            self._idle.put(None)
+            raise
+        with self._lock:
+            self._starting -= 1
+            self._all.append(browser)
+        return browser
+
+    def _launch(self, browser: BrowserManager) -> None:
+        """Start a pooled browser and copy the login into it.
+
+        Args:
+            browser: Pooled browser without a running driver.
+        """
+        browser.start()
+        try:
+            if self.session_source is not None:
+                browser.copy_session_from(self.session_source)
+        except Exception:
+            browser.close()
+            raise
+
+    def release(self, browser: BrowserManager) -> None:
+        """Return a browser to the pool.
+
+        Args:
+            browser: Browser previously obtained from acquire().
+        """
+        if self.clear_cookies_on_release and browser.driver is not None:
+            try:
+                browser.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except WebDriverException:
+                browser.close()  # Restarted on next checkout
+        self._idle.put(browser)
+
+    @contextmanager
+    def browser(self, timeout: float | None = None) -> Iterator[BrowserManager]:
+        """Context manager that checks a browser out and back in.
+
+        Args:
+            timeout: Seconds to wait for a free browser.
+
+        Yields:
+            A BrowserManager with a running driver.
+        """
+        browser = self.acquire(timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def close(self) -> None:
+        """Close every browser the pool has started."""
+        with self._lock:
+            for browser in self._all:
+                browser.close()
+            self._all.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -20,6 +20,10 @@ class Config:
     max_retries: int
     skip_verified: bool
     skip_follower_threshold: int | None
+    unfollow_budget: float = 30.0  # seconds per username, across retries
+    max_backoff: float = 30.0  # cap on one retry backoff, seconds
+    max_unfollows_per_hour: int | None = None  # shared by all workers; None for no cap
+    rng_seed: int | None = None  # Seed for action delays; None for unseeded
 
 
 class ConfigManager:
@@ -36,6 +40,10 @@ class ConfigManager:
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_SKIP_VERIFIED = True
     DEFAULT_SKIP_FOLLOWER_THRESHOLD = 1000000
+    DEFAULT_UNFOLLOW_BUDGET = 30.0
+    DEFAULT_MAX_BACKOFF = 30.0
+    DEFAULT_MAX_UNFOLLOWS_PER_HOUR = None
+    DEFAULT_RNG_SEED = None
     
     def __init__(self, filepath: str = "config.json"):
         """Initialize with config file path."""
@@ -54,6 +62,10 @@ class ConfigManager:
             max_retries=self.DEFAULT_MAX_RETRIES,
             skip_verified=self.DEFAULT_SKIP_VERIFIED,
             skip_follower_threshold=self.DEFAULT_SKIP_FOLLOWER_THRESHOLD,
+            unfollow_budget=self.DEFAULT_UNFOLLOW_BUDGET,
+            max_backoff=self.DEFAULT_MAX_BACKOFF,
+            max_unfollows_per_hour=self.DEFAULT_MAX_UNFOLLOWS_PER_HOUR,
+            rng_seed=self.DEFAULT_RNG_SEED,
         )
     
     def load(self) -> Config:
@@ -73,6 +85,21 @@ class ConfigManager:
         except (json.JSONDecodeError, OSError):
             return defaults
         
+        # Zero or negative means no cap, same as leaving it unset
+        max_unfollows_per_hour = data.get("max_unfollows_per_hour", defaults.max_unfollows_per_hour)
+        if max_unfollows_per_hour is not None:
+            max_unfollows_per_hour = int(max_unfollows_per_hour)
+            if max_unfollows_per_hour <= 0:
+                max_unfollows_per_hour = None
+        
+        # Workers add their index to the seed, so it must be a real int
+        rng_seed = data.get("rng_seed", defaults.rng_seed)
+        if rng_seed is not None:
+            try:
+                rng_seed = int(rng_seed)
+            except (TypeError, ValueError):
+                rng_seed = None
+        
         return Config(
             chrome_profile_path=data.get("chrome_profile_path", defaults.chrome_profile_path),
             action_delay_min=float(data.get("action_delay_min", defaults.action_delay_min)),
@@ -84,6 +111,10 @@ class ConfigManager:
             max_retries=int(data.get("max_retries", defaults.max_retries)),
             skip_verified=bool(data.get("skip_verified", defaults.skip_verified)),
             skip_follower_threshold=data.get("skip_follower_threshold", defaults.skip_follower_threshold),
+            unfollow_budget=float(data.get("unfollow_budget", defaults.unfollow_budget)),
+            max_backoff=float(data.get("max_backoff", defaults.max_backoff)),
+            max_unfollows_per_hour=max_unfollows_per_hour,
+            rng_seed=rng_seed,
         )
     
     def save(self, config: Config) -> None:
@@ -3,6 +3,27 @@
 import json
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def _dump_line(username: str, timestamp: str) -> bytes:
+    """Encode one history record as a newline-terminated JSON line."""
+    record = {"u": username, "t": timestamp}
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _loads(content: bytes):
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class HistoryManager:
@@ -10,13 +31,17 @@ class HistoryManager:
     
     Tracks which accounts have been unfollowed and when, to prevent
     re-processing the same accounts in future runs.
+    
+    The file is newline-delimited JSON, one {"u": username, "t": timestamp}
+    record per line, so recording an unfollow only appends to it. Files in
+    the older single-object format are converted on first load.
     """
     
     def __init__(self, filepath: str = "unfollowed_history.json"):
         """Initialize with history file path.
         
         Args:
-            filepath: Path to the JSON file storing unfollow history.
+            filepath: Path to the file storing unfollow history.
         """
         self.filepath = Path(filepath)
         self._history: dict[str, str] | None = None
@@ -36,20 +61,57 @@ class HistoryManager:
             return self._history
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure we have a dict of string -> string
-                if isinstance(data, dict):
-                    self._history = {str(k): str(v) for k, v in data.items()}
-                else:
-                    self._history = {}
-        except (json.JSONDecodeError, IOError):
+            content = self.filepath.read_bytes()
+        except IOError:
             self._history = {}
+            return self._history
         
+        legacy = self._parse_legacy(content)
+        if legacy is not None:
+            self.save(legacy)
+            return self._history
+        
+        history = {}
+        for line in content.splitlines():
+            try:
+                record = _loads(line)
+                history[str(record["u"])] = str(record["t"])
+            except (ValueError, TypeError, KeyError):
+                continue  # Blank or partially written line
+        self._history = history
         return self._history
     
+    @staticmethod
+    def _parse_legacy(content: bytes) -> dict[str, str] | None:
+        """Parse the older format: one JSON object of username -> timestamp.
+        
+        The older format was written with json.dump(indent=2): a single
+        object spanning the whole file, on several lines unless empty, with
+        no trailing newline. A file of newline-delimited records holding just
+        one record also parses as a single object, so it is told apart by
+        its shape: one line, terminated by a newline.
+        
+        Args:
+            content: Raw file content.
+        
+        Returns:
+            The legacy mapping, or None if content is not in that format.
+        """
+        body = content.strip()
+        if not body.startswith(b"{"):
+            return None
+        if b"\n" not in body and content.endswith(b"\n"):
+            return None  # A single newline-delimited record
+        try:
+            data = _loads(content)
+        except ValueError:
+            return None  # Several newline-delimited records
+        if not isinstance(data, dict):
+            return None
+        return {str(k): str(v) for k, v in data.items()}
+    
     def save(self, history: dict[str, str]) -> None:
-        """Save history to JSON file.
+        """Rewrite the history file with the given entries.
         
         Args:
             history: Dictionary mapping usernames to timestamps.
@@ -57,8 +119,9 @@ class HistoryManager:
         # Ensure parent directory exists
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        self.filepath.write_bytes(
+            b"".join(_dump_line(u, t) for u, t in history.items())
+        )
         
         # Update cached history
         self._history = history.copy()
@@ -69,10 +132,26 @@ class HistoryManager:
         Args:
             username: The Instagram username that was unfollowed.
         """
+        self.record_unfollows([username])
+    
+    def record_unfollows(self, usernames: Iterable[str]) -> None:
+        """Record several unfollow actions with a single append.
+        
+        All entries share the current UTC timestamp.
+        
+        Args:
+            usernames: The Instagram usernames that were unfollowed.
+        """
         history = self.load()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        history[username] = timestamp
-        self.save(history)
+        entries = dict.fromkeys(usernames, timestamp)
+        if not entries:
+            return
+        
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.filepath, 'ab') as f:
+            f.write(b"".join(_dump_line(u, timestamp) for u in entries))
+        history.update(entries)
     
     def was_unfollowed(self, username: str) -> bool:
         """Check if user was previously unfollowed.
@@ -85,3 +164,11 @@ class HistoryManager:
         """
         history = self.load()
         return username in history
+    
+    def iter_unfollowed(self) -> Iterator[str]:
+        """Iterate over every username in the unfollow history.
+        
+        Returns:
+            Iterator of previously unfollowed usernames.
+        """
+        return iter(self.load())
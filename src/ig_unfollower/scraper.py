@@ -7,10 +7,12 @@ IMPROVEMENTS OVER V1:
 4. Scroll delta tracking for true end detection
 """
 
+import json
 import logging
 import re
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
@@ -22,7 +24,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
-    NoSuchElementException,
+    WebDriverException,
 )
 
 from .browser import BrowserManager, retry_with_backoff
@@ -34,6 +36,63 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Top-level paths that look like profile links but are not usernames
+_EXCLUDED_PATHS = frozenset({
+    "explore", "direct", "accounts", "p", "reel",
+    "stories", "reels", "tv", "live", "tags", "locations",
+    "followers", "following", "",
+})
+
+# Profile count parsing: strip separators, then take the first run of digits
+_DIGIT_RE = re.compile(r"(\d+)")
+_COUNT_TRANSLATE = str.maketrans("", "", ", ")
+
+
+# Installed once per page; per-modal state lives on the modal element itself.
+# Validation happens here so only real usernames ever cross back to Python.
+_EXTRACT_HELPERS_JS = """
+    window.__iguExtract = window.__iguExtract || (() => {
+        const excluded = new Set(%s);
+        // Lowercased input only: [a-z0-9._], 1-30 chars, without regex setup
+        function validChars(username) {
+            const n = username.length;
+            let ok = n > 0 && n <= 30;
+            for (let i = 0; ok && i < n; i++) {
+                const c = username.charCodeAt(i);
+                ok = (c === 46) | (c === 95) | (c >= 48 && c <= 57) | (c >= 97 && c <= 122);
+            }
+            return ok;
+        }
+        return {
+            usernameFromHref(href) {
+                if (!href || href[0] !== '/') return null;
+                const username = href.split('?')[0].split('/')[1].toLowerCase();
+                return validChars(username) && !excluded.has(username) ? username : null;
+            },
+            seenFor(modal) {
+                return modal.__iguSeen || (modal.__iguSeen = new Set());
+            },
+            linksFor(modal) {
+                // Live collection: stays current as rows are added or recycled
+                return modal.__iguLinks || (modal.__iguLinks = modal.getElementsByTagName('a'));
+            },
+            scrollerFor(modal) {
+                // Cached once found; re-detected only if the node is replaced
+                const cached = modal.__iguScroll;
+                if (cached && cached.isConnected) return cached;
+                for (const div of modal.getElementsByTagName('div')) {
+                    const style = window.getComputedStyle(div);
+                    if ((style.overflowY === 'auto' || style.overflowY === 'scroll') &&
+                        div.scrollHeight > div.clientHeight) {
+                        return (modal.__iguScroll = div);
+                    }
+                }
+                return null;
+            }
+        };
+    })();
+""" % json.dumps(sorted(_EXCLUDED_PATHS))
+
 
 @dataclass
 class ScrollMetrics:
@@ -93,12 +152,20 @@ class MutationObserverManager:
         self.driver = driver
         self.observer_id = None
     
-    def inject(self, modal: WebElement) -> str:
+    def inject(self, modal: WebElement, exclude: str | None = None) -> str:
+        """Attach the observer to the modal.
+        
+        Args:
+            modal: Dialog element whose subtree is observed.
+            exclude: Lowercased username never to record (the account owner).
+        """
         self.observer_id = f"ig_obs_{int(time.time() * 1000)}"
         
-        self.driver.execute_script("""
+        self.driver.execute_script(_EXTRACT_HELPERS_JS + """
             const modal = arguments[0];
             const observerId = arguments[1];
+            const exclude = arguments[2];
+            const extractFromHref = window.__iguExtract.usernameFromHref;
             
             window[observerId] = {
                 usernames: new Set(),
@@ -106,21 +173,8 @@ class MutationObserverManager:
                 active: true
             };
             
-            const excludedPaths = new Set([
-                'explore', 'direct', 'accounts', 'p', 'reel', 
-                'stories', 'reels', 'tv', 'live', 'tags', 'locations',
-                'followers', 'following', ''
-            ]);
-            
-            function extractFromHref(href) {
-                if (!href || !href.startsWith('/')) return null;
-                const username = href.split('?')[0].replace(/^\\//, '').split('/')[0];
-                if (username && username.length > 0 && username.length <= 30 &&
-                    /^[a-zA-Z0-9._]+$/.test(username) &&
-                    !excludedPaths.has(username.toLowerCase())) {
-                    return username.toLowerCase();
-                }
-                return null;
+            function record(username) {
+                if (username && username !== exclude) window[observerId].usernames.add(username);
             }
             
             const observer = new MutationObserver((mutations) => {
@@ -128,20 +182,22 @@ class MutationObserverManager:
                 window[observerId].mutations += mutations.length;
                 
                 for (const mutation of mutations) {
+                    // Recycled rows keep their node but swap the href
+                    if (mutation.type === 'attributes') {
+                        record(extractFromHref(mutation.target.getAttribute('href')));
+                        continue;
+                    }
                     for (const node of mutation.addedNodes) {
                         if (node.nodeType !== Node.ELEMENT_NODE) continue;
                         
                         const processElement = (el) => {
                             if (el.tagName === 'A') {
-                                const href = el.getAttribute('href');
-                                const username = extractFromHref(href);
-                                if (username) window[observerId].usernames.add(username);
+                                record(extractFromHref(el.getAttribute('href')));
                             }
-                            if (el.querySelectorAll) {
-                                const links = el.querySelectorAll('a[href^="/"]');
+                            if (el.getElementsByTagName) {
+                                const links = el.getElementsByTagName('a');
                                 for (const link of links) {
-                                    const username = extractFromHref(link.getAttribute('href'));
-                                    if (username) window[observerId].usernames.add(username);
+                                    record(extractFromHref(link.getAttribute('href')));
                                 }
                             }
                         };
@@ -151,17 +207,28 @@ class MutationObserverManager:
                 }
             });
             
-            observer.observe(modal, { childList: true, subtree: true });
+            observer.observe(modal, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                attributeFilter: ['href']
+            });
             window[observerId].observer = observer;
             
-        """, modal, self.observer_id)
+            // Seed with rows rendered before the observer attached
+            for (const link of modal.getElementsByTagName('a')) {
+                record(extractFromHref(link.getAttribute('href')));
+            }
+            
+        """, modal, self.observer_id, exclude)
         
         logger.debug(f"Injected MutationObserver: {self.observer_id}")
         return self.observer_id
     
-    def get_usernames(self) -> set:
+    def get_usernames(self) -> list[str]:
+        """Return every username observed, already validated, lowercased and unique."""
         if not self.observer_id:
-            return set()
+            return []
         
         result = self.driver.execute_script(f"""
             const data = window['{self.observer_id}'];
@@ -169,7 +236,7 @@ class MutationObserverManager:
             return Array.from(data.usernames);
         """)
         
-        return set(result or [])
+        return result or []
     
     def get_stats(self) -> dict:
         if not self.observer_id:
@@ -204,17 +271,27 @@ class InstagramScraper:
     FOLLOWERS_LINK_SELECTOR = "a[href*='/followers/']"
     FOLLOWING_LINK_SELECTOR = "a[href*='/following/']"
     MODAL_SELECTOR = "div[role='dialog']"
+    MODAL_ROW_SELECTOR = "div[role='dialog'] a[href^='/']"
+    CLOSE_BUTTON_SELECTOR = "svg[aria-label='Close'], button[aria-label='Close']"
     
     SCROLL_INCREMENT = 150
-    MIN_SCROLL_DELAY = 0.2
-    MAX_SCROLL_DELAY = 1.5
+    MAX_STALL_DELAY = 5.0
+    MAX_STALL_TIME = 30.0
     MAX_NO_NEW_CONTENT = 25
     MAX_ITERATIONS = 800
+    SWEEP_PLATEAU_LIMIT = 5
+    SWEEP_BACKOFF_CAP = 4.0
+    SWEEP_NEAR_COMPLETE_RATIO = 0.95
+    SMALL_PROFILE_THRESHOLD = 200
+    SMALL_PROFILE_TIMEOUT = 5
     
     def __init__(self, browser: BrowserManager, username: str, config: Config | None = None):
         self.browser = browser
         self.username = username.lower()
+        self.profile_url = self.PROFILE_URL_TEMPLATE.format(username=self.username)
         self.config = config or ConfigManager().load()
+        # Profile counts for the currently loaded page; reset on navigation
+        self._cached_counts: tuple[int, int] | None = None
     
     @property
     def driver(self) -> "WebDriver":
@@ -224,11 +301,14 @@ class InstagramScraper:
 
     @retry_with_backoff(max_retries=3)
     def navigate_to_profile(self) -> bool:
-        url = self.PROFILE_URL_TEMPLATE.format(username=self.username)
+        url = self.profile_url
         logger.info(f"Navigating to: {url}")
         
+        if not self.browser.block_media_resources():
+            logger.debug("Media blocking unavailable, loading full page")
+        
+        self._cached_counts = None
         self.driver.get(url)
-        time.sleep(2)
         
         try:
             self.browser.wait_for_element(
@@ -243,25 +323,41 @@ class InstagramScraper:
             return False
     
     def get_profile_counts(self) -> tuple[int, int]:
+        if self._cached_counts is not None:
+            return self._cached_counts
+        
         followers_count = 0
         following_count = 0
         
         try:
-            followers_link = self.driver.find_element(By.CSS_SELECTOR, self.FOLLOWERS_LINK_SELECTOR)
-            text = followers_link.text.replace(",", "").replace(" ", "")
-            match = re.search(r"(\d+)", text)
-            if match:
-                followers_count = int(match.group(1))
-            
-            following_link = self.driver.find_element(By.CSS_SELECTOR, self.FOLLOWING_LINK_SELECTOR)
-            text = following_link.text.replace(",", "").replace(" ", "")
-            match = re.search(r"(\d+)", text)
-            if match:
-                following_count = int(match.group(1))
+            # One round-trip for both counts; span[title] holds the exact
+            # figure when the visible text is abbreviated ("1.2K")
+            texts = self.driver.execute_script("""
+                return [arguments[0], arguments[1]].map(sel => {
+                    const link = document.querySelector(sel);
+                    if (!link) return null;
+                    const span = link.querySelector('span[title]');
+                    return (span && span.title) || link.innerText;
+                });
+            """, self.FOLLOWERS_LINK_SELECTOR, self.FOLLOWING_LINK_SELECTOR)
+            
+            counts = []
+            for text in texts:
+                if text is None:
+                    logger.warning("Could not find profile count link")
+                    counts.append(0)
+                    continue
+                match = _DIGIT_RE.search(text.translate(_COUNT_TRANSLATE))
+                counts.append(int(match.group(1)) if match else 0)
+            followers_count, following_count = counts
             
             logger.info(f"Profile counts: {followers_count} followers, {following_count} following")
             
-        except (NoSuchElementException, ValueError) as e:
+            # Only a complete read is worth reusing for the next scrape
+            if None not in texts:
+                self._cached_counts = (followers_count, following_count)
+            
+        except (WebDriverException, ValueError) as e:
             logger.warning(f"Could not extract counts: {e}")
         
         return followers_count, following_count
@@ -276,13 +372,22 @@ class InstagramScraper:
             link.click()
             logger.info(f"Clicked {modal_name} link")
             
-            time.sleep(1)
             modal = self.browser.wait_for_element(
                 (By.CSS_SELECTOR, self.MODAL_SELECTOR),
                 timeout=self.config.element_timeout,
                 condition="visible"
             )
             logger.info(f"{modal_name} modal opened")
+            
+            # Ready once the first row link has rendered; an empty list never gets one
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.MODAL_ROW_SELECTOR))
+                )
+            except TimeoutException:
+                logger.warning(f"No rows rendered in {modal_name} modal yet")
+            
+            self.driver.execute_script(_EXTRACT_HELPERS_JS)
             return modal
             
         except TimeoutException:
@@ -291,46 +396,44 @@ class InstagramScraper:
     
     def _close_modal(self) -> None:
         try:
-            close_selectors = [
-                "svg[aria-label='Close']",
-                "button[aria-label='Close']",
-            ]
-            for selector in close_selectors:
-                try:
-                    btn = self.driver.find_element(By.CSS_SELECTOR, selector)
+            buttons = self.driver.find_elements(By.CSS_SELECTOR, self.CLOSE_BUTTON_SELECTOR)
+            for btn in buttons:
+                if btn.is_displayed() and btn.is_enabled():
                     btn.click()
-                    time.sleep(0.5)
+                    self._wait_for_modal_closed()
                     return
-                except NoSuchElementException:
-                    continue
             
             self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-            time.sleep(0.5)
+            self._wait_for_modal_closed()
             
         except Exception as e:
             logger.warning(f"Could not close modal: {e}")
 
-    def _extract_viewport_usernames(self, modal: WebElement, seen: set) -> tuple[list, dict]:
-        """Extract usernames from currently visible viewport only - O(k) where k≈12."""
+    def _wait_for_modal_closed(self, timeout: float = 2.0) -> None:
+        """Wait until the dialog has been removed from the page.
+        
+        Args:
+            timeout: Maximum seconds to wait for the dialog to disappear
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, self.MODAL_SELECTOR))
+            )
+        except TimeoutException:
+            logger.debug("Modal still present after close attempt")
+
+    def _extract_viewport_usernames(self, modal: WebElement) -> tuple[list, dict]:
+        """Extract usernames from currently visible viewport only - O(k) where k≈12.
+        
+        Usernames already returned for this modal are remembered in the
+        browser, so each call only reports ones not seen before.
+        """
         result = self.driver.execute_script("""
             const modal = arguments[0];
-            const seenLower = new Set(arguments[1]);
-            
-            const excludedPaths = new Set([
-                'explore', 'direct', 'accounts', 'p', 'reel', 
-                'stories', 'reels', 'tv', 'live', 'tags', 'locations',
-                'followers', 'following', ''
-            ]);
-            
-            let scrollable = null;
-            for (const div of modal.querySelectorAll('div')) {
-                const style = window.getComputedStyle(div);
-                if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && 
-                    div.scrollHeight > div.clientHeight + 10) {
-                    scrollable = div;
-                    break;
-                }
-            }
+            const exclude = arguments[1];
+            const helpers = window.__iguExtract;
+            const seen = helpers.seenFor(modal);
+            const scrollable = helpers.scrollerFor(modal);
             
             if (!scrollable) {
                 return { error: 'No scrollable', newUsernames: [], scrollInfo: {} };
@@ -339,24 +442,18 @@ class InstagramScraper:
             const rect = scrollable.getBoundingClientRect();
             const newUsernames = [];
             
-            for (const link of modal.querySelectorAll('a[href^="/"]')) {
-                const linkRect = link.getBoundingClientRect();
+            for (const link of helpers.linksFor(modal)) {
+                // Cheap checks first; layout is only read for unseen candidates
+                const username = helpers.usernameFromHref(link.getAttribute('href'));
+                if (!username || username === exclude || seen.has(username)) continue;
                 
+                const linkRect = link.getBoundingClientRect();
                 if (linkRect.top < rect.top - 100 || linkRect.bottom > rect.bottom + 100) {
                     continue;
                 }
                 
-                const href = link.getAttribute('href');
-                if (!href) continue;
-                
-                const username = href.split('?')[0].replace(/^\\//, '').split('/')[0];
-                
-                if (username && username.length > 0 && username.length <= 30 &&
-                    /^[a-zA-Z0-9._]+$/.test(username) &&
-                    !excludedPaths.has(username.toLowerCase()) &&
-                    !seenLower.has(username.toLowerCase())) {
-                    newUsernames.push(username.toLowerCase());
-                }
+                seen.add(username);
+                newUsernames.push(username);
             }
             
             return {
@@ -367,77 +464,144 @@ class InstagramScraper:
                     clientHeight: scrollable.clientHeight
                 }
             };
-        """, modal, list(seen))
+        """, modal, self.username)
         
         return result.get('newUsernames', []), result.get('scrollInfo', {})
     
-    def _scroll_increment(self, modal: WebElement, pixels: int) -> dict:
-        return self.driver.execute_script("""
-            const modal = arguments[0];
-            const pixels = arguments[1];
-            
-            for (const div of modal.querySelectorAll('div')) {
-                const style = window.getComputedStyle(div);
-                if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && 
-                    div.scrollHeight > div.clientHeight) {
-                    
-                    const before = div.scrollTop;
-                    div.scrollBy(0, pixels);
-                    const after = div.scrollTop;
-                    
-                    return {
-                        before: before,
-                        after: after,
-                        delta: after - before,
-                        scrollHeight: div.scrollHeight,
-                        clientHeight: div.clientHeight
-                    };
-                }
-            }
-            return { error: 'No scrollable' };
-        """, modal, pixels)
+    def _evaluate(self, expression: str) -> Any:
+        """Evaluate a JS expression through CDP Runtime.evaluate.
+        
+        Cheaper than execute_script for hot loops: no WebDriver command
+        wrapping and no element serialization. The expression must locate
+        any elements it needs itself.
+        
+        Args:
+            expression: JS expression whose value is returned
+            
+        Returns:
+            The JSON-compatible result value, or None if the script threw
+        """
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+        })
+        if "exceptionDetails" in response:
+            logger.debug(f"Runtime.evaluate failed: {response['exceptionDetails'].get('text')}")
+            return None
+        return response.get("result", {}).get("value")
+    
+    def _scroll_increment(self, pixels: int, observer_id: str | None = None) -> dict:
+        """Scroll the modal list and report the observer's running username count."""
+        result = self._evaluate("""(() => {
+            const modal = document.querySelector(%s);
+            const observed = window[%s];
+            const div = modal && window.__iguExtract.scrollerFor(modal);
+            if (!div) return { error: 'No scrollable' };
+            
+            const before = div.scrollTop;
+            div.scrollBy(0, %d);
+            const after = div.scrollTop;
+            
+            return {
+                before: before,
+                after: after,
+                delta: after - before,
+                scrollHeight: div.scrollHeight,
+                clientHeight: div.clientHeight,
+                observed: observed ? observed.usernames.size : 0
+            };
+        })()""" % (json.dumps(self.MODAL_SELECTOR), json.dumps(observer_id), pixels))
+        return result or {"error": "Evaluation failed"}
+    
+    def _wait_for_new_rows(
+        self,
+        observer_id: str | None,
+        observed: int,
+        scroll_height: int,
+        timeout: float
+    ) -> bool:
+        """Wait until the observer sees new usernames or the list grows.
+        
+        Args:
+            observer_id: Observer whose username count is watched
+            observed: Username count at the last scroll
+            scroll_height: Scroll height at the last scroll
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if new content appeared, False on timeout
+        """
+        expression = """(() => {
+            const observed = window[%s];
+            if (observed && observed.usernames.size > %d) return true;
+            const modal = document.querySelector(%s);
+            const div = modal && window.__iguExtract.scrollerFor(modal);
+            return !!div && div.scrollHeight > %d;
+        })()""" % (json.dumps(observer_id), observed, json.dumps(self.MODAL_SELECTOR), scroll_height)
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: self._evaluate(expression)
+            )
+            return True
+        except TimeoutException:
+            return False
     
     def _scroll_to_position(self, modal: WebElement, position: int):
         self.driver.execute_script("""
             const modal = arguments[0];
             const pos = arguments[1];
-            
-            for (const div of modal.querySelectorAll('div')) {
-                const style = window.getComputedStyle(div);
-                if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && 
-                    div.scrollHeight > div.clientHeight) {
-                    div.scrollTop = pos;
-                    break;
-                }
-            }
+            const div = window.__iguExtract.scrollerFor(modal);
+            if (div) div.scrollTop = pos;
         """, modal, position)
     
     def _full_dom_extract(self, modal: WebElement) -> list:
-        return self.driver.execute_script("""
+        result = self.driver.execute_script("""
             const modal = arguments[0];
-            const excludedPaths = new Set([
-                'explore', 'direct', 'accounts', 'p', 'reel', 
-                'stories', 'reels', 'tv', 'live', 'tags', 'locations',
-                'followers', 'following', ''
-            ]);
-            
+            const exclude = arguments[1];
+            const helpers = window.__iguExtract;
             const usernames = new Set();
             
-            for (const link of modal.querySelectorAll('a[href^="/"]')) {
-                const href = link.getAttribute('href');
-                if (!href) continue;
-                
-                const username = href.split('?')[0].replace(/^\\//, '').split('/')[0];
-                
-                if (username && username.length > 0 && username.length <= 30 &&
-                    /^[a-zA-Z0-9._]+$/.test(username) &&
-                    !excludedPaths.has(username.toLowerCase())) {
-                    usernames.add(username.toLowerCase());
-                }
+            for (const link of helpers.linksFor(modal)) {
+                const username = helpers.usernameFromHref(link.getAttribute('href'));
+                if (username && username !== exclude) usernames.add(username);
             }
             
             return Array.from(usernames);
-        """, modal)
+        """, modal, self.username)
+        return result or []
+
+    def _fast_path_small_profile(self, modal: WebElement, expected_count: int) -> tuple[list[str], bool]:
+        """Bulk scroll-and-extract for small lists that load in a page or two.
+        
+        Keeps jumping to the bottom and collecting rendered usernames until
+        the expected count is reached or SMALL_PROFILE_TIMEOUT runs out. On
+        timeout the list is scrolled back to the top so the full scroll can
+        start from the beginning.
+        
+        Returns:
+            The usernames collected and whether the expected count was
+            reached. If not, the caller falls through to the full scroll.
+        """
+        usernames: dict[str, None] = {}
+        
+        def loaded(_) -> bool:
+            self.driver.execute_script("""
+                const div = window.__iguExtract.scrollerFor(arguments[0]);
+                if (div) div.scrollTop = div.scrollHeight;
+            """, modal)
+            usernames.update(dict.fromkeys(self._full_dom_extract(modal)))
+            return len(usernames) >= expected_count
+        
+        try:
+            WebDriverWait(self.driver, self.SMALL_PROFILE_TIMEOUT, poll_frequency=0.25).until(loaded)
+        except TimeoutException:
+            logger.info(f"Fast path got {len(usernames)}/{expected_count}, falling back to full scroll")
+            self._scroll_to_position(modal, 0)
+            return list(usernames), False
+        
+        logger.info(f"Fast path: {len(usernames)}/{expected_count}")
+        return list(usernames), True
 
     def _scroll_modal_complete(
         self,
@@ -448,28 +612,39 @@ class InstagramScraper:
         """Complete scroll with 100% extraction guarantee using 4-phase approach."""
         logger.info(f"Starting complete scroll (expecting {expected_count})")
         
-        time.sleep(2)
+        # Dict keys keep first-seen order and merge in bulk at C level
+        all_usernames: dict[str, None] = {}
+        
+        if 0 < expected_count < self.SMALL_PROFILE_THRESHOLD:
+            usernames, complete = self._fast_path_small_profile(modal, expected_count)
+            if complete:
+                if progress_callback:
+                    progress_callback(len(usernames), expected_count, "Complete")
+                return usernames
+            # Keep what the fast path already found
+            all_usernames.update(dict.fromkeys(usernames))
         
-        all_usernames: set[str] = set()
         state = ScrollState()
         observer = MutationObserverManager(self.driver)
+        delay_calc = AdaptiveDelayCalculator(
+            self.config.min_scroll_delay, self.config.max_scroll_delay
+        )
         
-        # PHASE 1: Observer + Initial scan
-        observer.inject(modal)
-        
-        initial = self._full_dom_extract(modal)
-        for u in initial:
-            all_usernames.add(u)
-        state.total_items = len(all_usernames)
+        # PHASE 1: Observer, seeded with the rows already rendered
+        observer.inject(modal, exclude=self.username)
+        state.total_items = observer.get_stats()["usernames"]
         
-        logger.info(f"Initial scan: {len(all_usernames)} usernames")
+        logger.info(f"Initial scan: {state.total_items} usernames")
         
-        # PHASE 2: Incremental scroll down
+        # PHASE 2: Incremental scroll down. Usernames accumulate in the
+        # browser; only the observer's count crosses the bridge per scroll.
         iteration = 0
+        stall_time = 0.0
+        last_tick = time.monotonic()
         while iteration < self.MAX_ITERATIONS:
             iteration += 1
             
-            scroll_result = self._scroll_increment(modal, self.SCROLL_INCREMENT)
+            scroll_result = self._scroll_increment(self.SCROLL_INCREMENT, observer.observer_id)
             
             if scroll_result.get('error'):
                 logger.warning(f"Scroll error: {scroll_result['error']}")
@@ -482,27 +657,26 @@ class InstagramScraper:
             )
             state.metrics.record(0, scroll_result['delta'])
             
-            new_usernames, _ = self._extract_viewport_usernames(modal, all_usernames)
-            
-            before = len(all_usernames)
-            for u in new_usernames:
-                all_usernames.add(u)
-            items_added = len(all_usernames) - before
-            
-            state.total_items = len(all_usernames)
+            items_added = scroll_result['observed'] - state.total_items
+            state.total_items = scroll_result['observed']
             state.metrics.record(items_added, scroll_result['delta'])
             
+            now = time.monotonic()
+            delay_calc.record_load(items_added, now - last_tick)
+            last_tick = now
+            
             if items_added > 0:
                 state.consecutive_no_new = 0
+                stall_time = 0.0
             else:
                 state.consecutive_no_new += 1
             
             if progress_callback:
-                progress_callback(len(all_usernames), expected_count, "Scrolling...")
+                progress_callback(state.total_items, expected_count, "Scrolling...")
             
             if iteration % 20 == 0:
                 logger.info(
-                    f"#{iteration}: {len(all_usernames)}/{expected_count} | "
+                    f"#{iteration}: {state.total_items}/{expected_count} | "
                     f"pos={state.position} | delta={scroll_result['delta']} | "
                     f"no_new={state.consecutive_no_new}"
                 )
@@ -511,19 +685,34 @@ class InstagramScraper:
             if should_stop:
                 logger.info(f"Terminating: {reason}")
                 break
+            if stall_time >= self.MAX_STALL_TIME:
+                logger.info(f"Terminating: stalled for {stall_time:.1f}s")
+                break
             
-            if state.consecutive_no_new > 10:
-                time.sleep(self.MAX_SCROLL_DELAY)
-            elif items_added > 0:
-                time.sleep(self.MIN_SCROLL_DELAY)
+            if state.consecutive_no_new <= 5:
+                delay = delay_calc.get_next_delay()
             else:
-                time.sleep((self.MIN_SCROLL_DELAY + self.MAX_SCROLL_DELAY) / 2)
+                # Exponential backoff so a dead list converges in a few waits
+                delay = min(
+                    self.config.scroll_delay * (1.5 ** (state.consecutive_no_new - 5)),
+                    self.MAX_STALL_DELAY
+                )
+            if state.consecutive_no_new:
+                stall_time += delay
+            # The delay is only an upper bound; move on as soon as rows arrive
+            self._wait_for_new_rows(
+                observer.observer_id, state.total_items, state.scroll_height, delay
+            )
+        
+        # Single extraction once scrolling has finished
+        all_usernames.update(dict.fromkeys(observer.get_usernames()))
         
         completeness = (len(all_usernames) / expected_count * 100) if expected_count > 0 else 100
         logger.info(f"Phase 2: {len(all_usernames)}/{expected_count} ({completeness:.1f}%) after {iteration} scrolls")
         
         # PHASE 3: Reverse pass if incomplete
-        if completeness < 98 and expected_count > 0:
+        needs_reverse_pass = completeness < 98 and expected_count > 0
+        if needs_reverse_pass:
             logger.info("Starting reverse pass...")
             
             if progress_callback:
@@ -532,32 +721,49 @@ class InstagramScraper:
             self._scroll_to_position(modal, 0)
             time.sleep(1)
             
-            reverse_iter = 0
-            while reverse_iter < self.MAX_ITERATIONS // 2:
-                reverse_iter += 1
-                
-                scroll_result = self._scroll_increment(modal, self.SCROLL_INCREMENT * 2)
-                if scroll_result.get('error') or scroll_result['delta'] < 5:
-                    break
+            # Absolute positions computed once from the settled list height
+            step = self.SCROLL_INCREMENT * 2
+            positions = list(range(step, state.scroll_height, step))[:self.MAX_ITERATIONS // 2]
+            
+            zero_streak = 0
+            last_tick = time.monotonic()
+            for reverse_iter, position in enumerate(positions, 1):
+                self._scroll_to_position(modal, position)
                 
-                new_usernames, _ = self._extract_viewport_usernames(modal, all_usernames)
-                for u in new_usernames:
-                    all_usernames.add(u)
+                new_usernames, _ = self._extract_viewport_usernames(modal)
+                before = len(all_usernames)
+                all_usernames.update(dict.fromkeys(new_usernames))
+                items_added = len(all_usernames) - before
                 
                 if expected_count > 0 and len(all_usernames) >= expected_count:
                     break
                 
-                time.sleep(self.MIN_SCROLL_DELAY)
+                # Stop once the pass plateaus instead of walking the whole list
+                zero_streak = 0 if items_added else zero_streak + 1
+                if zero_streak >= 2 and len(all_usernames) >= expected_count * self.SWEEP_NEAR_COMPLETE_RATIO:
+                    logger.info(f"Reverse pass near target and stalled after {reverse_iter} scrolls")
+                    break
+                if zero_streak >= self.SWEEP_PLATEAU_LIMIT:
+                    logger.info(f"Reverse pass plateaued after {reverse_iter} scrolls")
+                    break
+                
+                now = time.monotonic()
+                delay_calc.record_load(items_added, now - last_tick)
+                last_tick = now
+                # Back off exponentially while positions keep coming up empty
+                time.sleep(min(
+                    delay_calc.get_next_delay() * (2 ** zero_streak),
+                    self.SWEEP_BACKOFF_CAP
+                ))
             
             logger.info(f"Reverse pass: {len(all_usernames)} total")
         
-        # PHASE 4: Merge observer results
-        observed = observer.get_usernames()
+        # PHASE 4: Merge anything the observer caught during the reverse pass
         stats = observer.get_stats()
-        observer.disconnect()
-        
         before_merge = len(all_usernames)
-        all_usernames.update(observed)
+        if needs_reverse_pass:
+            all_usernames.update(dict.fromkeys(observer.get_usernames()))
+        observer.disconnect()
         
         logger.info(
             f"Observer merge: +{len(all_usernames) - before_merge} "
@@ -565,11 +771,7 @@ class InstagramScraper:
         )
         
         # Final full scan
-        final_scan = self._full_dom_extract(modal)
-        for u in final_scan:
-            all_usernames.add(u)
-        
-        all_usernames.discard(self.username)
+        all_usernames.update(dict.fromkeys(self._full_dom_extract(modal)))
         
         final_completeness = (len(all_usernames) / expected_count * 100) if expected_count > 0 else 100
         logger.info(f"FINAL: {len(all_usernames)}/{expected_count} ({final_completeness:.1f}%)")
@@ -584,7 +786,7 @@ class InstagramScraper:
         """Scrape all followers with 100% completion guarantee."""
         logger.info(f"Scraping followers for: {self.username}")
         
-        if self.username not in self.driver.current_url.lower():
+        if not self.driver.current_url.lower().startswith(self.profile_url):
             self.navigate_to_profile()
         
         followers_count, _ = self.get_profile_counts()
@@ -615,7 +817,7 @@ class InstagramScraper:
         """Scrape all following with 100% completion guarantee."""
         logger.info(f"Scraping following for: {self.username}")
         
-        if self.username not in self.driver.current_url.lower():
+        if not self.driver.current_url.lower().startswith(self.profile_url):
             self.navigate_to_profile()
         
         _, following_count = self.get_profile_counts()
@@ -637,6 +839,37 @@ class InstagramScraper:
             return usernames
         finally:
             self._close_modal()
+    
+    def scrape_both_parallel(
+        self,
+        progress_callback: Callable[[int, int, str], None] | None = None
+    ) -> tuple[list[str], list[str]]:
+        """Scrape followers and following at the same time in two browsers.
+        
+        Both scrapes spend most of their time waiting on Instagram to load
+        rows, so running them side by side roughly halves wall-clock time.
+        A second, ephemeral browser is started with this browser's session
+        cookies and closed afterwards.
+        
+        Args:
+            progress_callback: Called from both worker threads; updates
+                from the two lists interleave.
+            
+        Returns:
+            Tuple of (followers, following) usernames.
+        """
+        helper = BrowserManager(config=self.config, ephemeral=True)
+        helper.start()
+        try:
+            helper.copy_session_from(self.browser)
+            following_scraper = InstagramScraper(helper, self.username, self.config)
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                followers_future = executor.submit(self.scrape_followers, progress_callback)
+                following_future = executor.submit(following_scraper.scrape_following, progress_callback)
+                return followers_future.result(), following_future.result()
+        finally:
+            helper.close()
 
 
 # Legacy compatibility
@@ -1,8 +1,12 @@
 """Skip list management module for filtering accounts."""
 
 import json
-import os
-from typing import Optional
+from typing import Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 
 class SkipListManager:
@@ -31,21 +35,18 @@ class SkipListManager:
         if self._skip_list is not None:
             return self._skip_list
         
-        if not os.path.exists(self.filepath):
-            self._skip_list = set()
-            return self._skip_list
-        
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Handle both formats: {"usernames": [...]} or just [...]
-                if isinstance(data, dict) and "usernames" in data:
-                    self._skip_list = set(data["usernames"])
-                elif isinstance(data, list):
-                    self._skip_list = set(data)
-                else:
-                    self._skip_list = set()
+            with open(self.filepath, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            # Handle both formats: {"usernames": [...]} or just [...]
+            if isinstance(data, dict) and "usernames" in data:
+                self._skip_list = set(data["usernames"])
+            elif isinstance(data, list):
+                self._skip_list = set(data)
+            else:
+                self._skip_list = set()
         except (json.JSONDecodeError, IOError):
+            # Covers a missing file too (FileNotFoundError is an IOError)
             self._skip_list = set()
         
         return self._skip_list
@@ -63,7 +64,12 @@ class SkipListManager:
         if self._skip_list is None:
             self._skip_list = set()
         
-        data = {"usernames": sorted(list(self._skip_list))}
+        data = {"usernames": sorted(self._skip_list)}
+        
+        if orjson is not None:
+            with open(self.filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         
         with open(self.filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
@@ -71,23 +77,41 @@ class SkipListManager:
     def add(self, username: str) -> None:
         """Add username to skip list.
         
+        The file is only rewritten if the username was not already present.
+        
         Args:
             username: Username to add to the skip list
         """
         skip_list = self.load()
+        if username in skip_list:
+            return
         skip_list.add(username)
-        self._skip_list = skip_list
         self.save()
     
+    def add_many(self, usernames: Iterable[str]) -> None:
+        """Add several usernames with a single write.
+        
+        Args:
+            usernames: Usernames to add to the skip list
+        """
+        skip_list = self.load()
+        size = len(skip_list)
+        skip_list.update(usernames)
+        if len(skip_list) != size:
+            self.save()
+    
     def remove(self, username: str) -> None:
         """Remove username from skip list.
         
+        The file is only rewritten if the username was present.
+        
         Args:
             username: Username to remove from the skip list
         """
         skip_list = self.load()
-        skip_list.discard(username)
-        self._skip_list = skip_list
+        if username not in skip_list:
+            return
+        skip_list.remove(username)
         self.save()
     
     def contains(self, username: str) -> bool:
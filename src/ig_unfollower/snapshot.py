@@ -7,6 +7,47 @@ import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def _dumps(data: dict, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when installed.
+    
+    Args:
+        data: JSON-compatible dictionary
+        pretty: Indent by two spaces; compact output otherwise
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(content: str | bytes) -> dict:
+    """Parse JSON text or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes via a temporary sibling and an atomic rename.
+    
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one.
+    
+    Args:
+        path: Destination file
+        data: Content to write
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 
 @dataclass
 class Snapshot:
@@ -33,6 +74,42 @@ class Snapshot:
             self.followers_count = len(self.followers)
         if self.following_count == 0 and self.following:
             self.following_count = len(self.following)
+    
+    @classmethod
+    def from_parsed(cls, data: dict) -> "Snapshot":
+        """Build a Snapshot from already-parsed stored JSON.
+        
+        Stored snapshots always carry their counts, so this skips __init__
+        and the __post_init__ count fill-in.
+        
+        Args:
+            data: Dictionary as produced by SnapshotManager.to_bytes
+            
+        Returns:
+            Snapshot populated from data
+        """
+        snapshot = object.__new__(cls)
+        snapshot.__dict__.update(
+            timestamp=data["timestamp"],
+            followers=data["followers"],
+            following=data["following"],
+            followers_count=data["followers_count"],
+            following_count=data["following_count"],
+            username=data.get("username"),  # Optional for backward compatibility
+        )
+        return snapshot
+    
+    def copy(self) -> "Snapshot":
+        """Return a copy with its own username lists.
+        
+        Returns:
+            Snapshot equal to this one that shares no mutable state with it
+        """
+        return type(self).from_parsed({
+            **vars(self),
+            "followers": list(self.followers),
+            "following": list(self.following),
+        })
 
 
 class SnapshotManager:
@@ -47,13 +124,17 @@ class SnapshotManager:
             data_dir: Directory path for storing snapshot files
         """
         self.data_dir = Path(data_dir)
+        # (mtime_ns, parsed pointer data) for the latest pointer file
+        self._pointer_cache: Optional[tuple[int, dict]] = None
+        # (filename, private copy of the snapshot) most recently saved
+        self._memo: Optional[tuple[str, Snapshot]] = None
     
     def _ensure_data_dir(self) -> None:
         """Create data directory if it doesn't exist."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
     
     def to_json(self, snapshot: Snapshot) -> str:
-        """Serialize snapshot to JSON string.
+        """Serialize snapshot to an indented JSON string.
         
         Args:
             snapshot: Snapshot object to serialize
@@ -61,6 +142,21 @@ class SnapshotManager:
         Returns:
             JSON string representation of the snapshot
         """
+        return self.to_bytes(snapshot, pretty=True).decode("utf-8")
+    
+    def to_bytes(self, snapshot: Snapshot, pretty: bool = False) -> bytes:
+        """Serialize snapshot to UTF-8 JSON bytes.
+        
+        Args:
+            snapshot: Snapshot object to serialize
+            pretty: Indent the output for human reading
+            
+        Returns:
+            JSON bytes, compact unless pretty is set
+        """
+        if orjson is not None:
+            # orjson serializes dataclasses natively, in field order
+            return orjson.dumps(snapshot, option=orjson.OPT_INDENT_2 if pretty else None)
         data = {
             "timestamp": snapshot.timestamp,
             "followers": snapshot.followers,
@@ -69,26 +165,18 @@ class SnapshotManager:
             "following_count": snapshot.following_count,
             "username": snapshot.username
         }
-        return json.dumps(data, indent=2)
+        return _dumps(data, pretty)
     
-    def from_json(self, json_str: str) -> Snapshot:
+    def from_json(self, json_str: str | bytes) -> Snapshot:
         """Deserialize JSON string to Snapshot.
         
         Args:
-            json_str: JSON string to deserialize
+            json_str: JSON string (or UTF-8 bytes) to deserialize
             
         Returns:
             Snapshot object reconstructed from JSON
         """
-        data = json.loads(json_str)
-        return Snapshot(
-            timestamp=data["timestamp"],
-            followers=data["followers"],
-            following=data["following"],
-            followers_count=data["followers_count"],
-            following_count=data["following_count"],
-            username=data.get("username")  # Optional for backward compatibility
-        )
+        return Snapshot.from_parsed(_loads(json_str))
 
     def save(self, snapshot: Snapshot) -> str:
         """Save snapshot to JSON file with timestamp-based filename.
@@ -109,15 +197,55 @@ class SnapshotManager:
         filename = f"snapshot_{safe_timestamp}.json"
         filepath = self.data_dir / filename
         
-        # Write snapshot to file
-        json_content = self.to_json(snapshot)
-        filepath.write_text(json_content, encoding="utf-8")
+        # Stored compact; snapshots are read back by code, not by hand
+        _atomic_write_bytes(filepath, self.to_bytes(snapshot))
         
         # Update latest pointer
         self._update_latest_pointer(str(filename), snapshot.username)
+        # Copied so later changes to the caller's object don't leak into loads
+        self._memo = (filename, snapshot.copy())
         
         return str(filepath)
     
+    def clear_cache(self) -> None:
+        """Forget the cached pointer data and last saved snapshot."""
+        self._pointer_cache = None
+        self._memo = None
+    
+    def _load_named(self, filename: str) -> Snapshot:
+        """Load a snapshot by filename, reusing the last saved one if it matches.
+        
+        Args:
+            filename: Snapshot filename relative to the data directory
+            
+        Returns:
+            Snapshot object (a fresh copy of the memoized one on a cache hit)
+        """
+        if self._memo is not None and self._memo[0] == filename:
+            return self._memo[1].copy()
+        return self.load(str(self.data_dir / filename))
+    
+    def _read_pointer(self) -> dict:
+        """Read the latest pointer file, reusing the parse while it is unchanged.
+        
+        Returns:
+            Parsed pointer data (a fresh copy the caller may modify)
+            
+        Raises:
+            FileNotFoundError: If the pointer file doesn't exist
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        pointer_path = self.data_dir / self.LATEST_POINTER_FILE
+        mtime = pointer_path.stat().st_mtime_ns
+        
+        if self._pointer_cache is None or self._pointer_cache[0] != mtime:
+            self._pointer_cache = (mtime, _loads(pointer_path.read_bytes()))
+        
+        data = dict(self._pointer_cache[1])
+        if "by_user" in data:
+            data["by_user"] = dict(data["by_user"])
+        return data
+    
     def _update_latest_pointer(self, filename: str, username: Optional[str] = None) -> None:
         """Update the latest pointer file to reference the given snapshot.
         
@@ -128,12 +256,9 @@ class SnapshotManager:
         pointer_path = self.data_dir / self.LATEST_POINTER_FILE
         
         # Load existing pointers
-        if pointer_path.exists():
-            try:
-                pointer_data = json.loads(pointer_path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, FileNotFoundError):
-                pointer_data = {}
-        else:
+        try:
+            pointer_data = self._read_pointer()
+        except (json.JSONDecodeError, FileNotFoundError):
             pointer_data = {}
         
         # Update global latest
@@ -145,7 +270,8 @@ class SnapshotManager:
                 pointer_data["by_user"] = {}
             pointer_data["by_user"][username.lower()] = filename
         
-        pointer_path.write_text(json.dumps(pointer_data, indent=2), encoding="utf-8")
+        _atomic_write_bytes(pointer_path, _dumps(pointer_data))
+        self._pointer_cache = (pointer_path.stat().st_mtime_ns, pointer_data)
     
     def load_latest(self, username: Optional[str] = None) -> Optional[Snapshot]:
         """Load most recent snapshot from latest pointer.
@@ -156,20 +282,15 @@ class SnapshotManager:
         Returns:
             Most recent Snapshot object, or None if no snapshots exist
         """
-        pointer_path = self.data_dir / self.LATEST_POINTER_FILE
-        
-        if not pointer_path.exists():
-            return None
-        
         try:
-            pointer_data = json.loads(pointer_path.read_text(encoding="utf-8"))
+            pointer_data = self._read_pointer()
             
             # If username specified, try to get user-specific latest
             if username:
                 by_user = pointer_data.get("by_user", {})
                 latest_filename = by_user.get(username.lower())
                 if latest_filename:
-                    return self.load(str(self.data_dir / latest_filename))
+                    return self._load_named(latest_filename)
             
             # Fall back to global latest
             latest_filename = pointer_data.get("latest")
@@ -177,7 +298,7 @@ class SnapshotManager:
             if not latest_filename:
                 return None
             
-            return self.load(str(self.data_dir / latest_filename))
+            return self._load_named(latest_filename)
         except (json.JSONDecodeError, KeyError, FileNotFoundError):
             return None
     
@@ -195,5 +316,4 @@ class SnapshotManager:
             json.JSONDecodeError: If the file contains invalid JSON
         """
         path = Path(filepath)
-        json_content = path.read_text(encoding="utf-8")
-        return self.from_json(json_content)
+        return self.from_json(path.read_bytes())
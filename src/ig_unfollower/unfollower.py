@@ -1,17 +1,21 @@
 """Unfollow executor module for automated unfollow actions."""
 
+import asyncio
+import json
 import logging
+import math
+import queue
 import random
+import threading
 import time
 from dataclasses import dataclass, field
+from typing import Any, Callable
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     WebDriverException,
 )
 
@@ -23,6 +27,189 @@ from .history import HistoryManager
 logger = logging.getLogger(__name__)
 
 
+# Installed on every page of the session; finders shared by the unfollow script
+_PAGE_HELPERS_NAME = "unfollow_helpers"
+_PAGE_HELPERS_JS = """
+    window.__igBot = window.__igBot || (function() {
+        var followingMethods = {
+            // Method 1: Find button with "Following" text in header
+            'header button text': function() {
+                for (var btn of document.querySelectorAll('header button')) {
+                    if (btn.textContent.trim() === 'Following') return btn;
+                }
+                return null;
+            },
+            // Method 2: Find button containing div with "Following" text
+            'button>div text': function() {
+                for (var btn of document.querySelectorAll('button')) {
+                    for (var div of btn.querySelectorAll('div')) {
+                        if (div.textContent.trim() === 'Following') return btn;
+                    }
+                }
+                return null;
+            },
+            // Method 3: Look for the specific button class pattern
+            'class _aswp': function() {
+                for (var btn of document.querySelectorAll('button[class*="_aswp"]')) {
+                    if (btn.textContent.includes('Following')) return btn;
+                }
+                return null;
+            }
+        };
+        var unfollowMethods = {
+            // Method 1: clickable elements with Unfollow text
+            'role=button direct': function(dialog) {
+                for (var btn of dialog.querySelectorAll('[role="button"]')) {
+                    if (btn.textContent.trim() === 'Unfollow') return btn;
+                }
+                return null;
+            },
+            // Method 2: spans with Unfollow text, clicking the nearest clickable parent
+            'span': function(dialog) {
+                for (var span of dialog.querySelectorAll('span')) {
+                    if (span.textContent.trim() === 'Unfollow') {
+                        return span.closest('[role="button"]') || span.closest('button') || span;
+                    }
+                }
+                return null;
+            },
+            // Method 3: TreeWalker over text nodes
+            'treewalker': function(dialog) {
+                var walker = document.createTreeWalker(dialog, NodeFilter.SHOW_TEXT, null, false);
+                while (walker.nextNode()) {
+                    if (walker.currentNode.textContent.trim() === 'Unfollow') {
+                        var el = walker.currentNode.parentElement;
+                        return el.closest('[role="button"]') || el.closest('button') || el;
+                    }
+                }
+                return null;
+            }
+        };
+
+        // Try the method that worked last time first, then the rest in order
+        function find(methods, arg, prefer) {
+            var names = Object.keys(methods);
+            if (prefer && methods[prefer]) {
+                names = [prefer].concat(names.filter(function(n) { return n !== prefer; }));
+            }
+            for (var name of names) {
+                var el = methods[name](arg);
+                if (el) return {el: el, method: name};
+            }
+            return null;
+        }
+
+        // True once the profile header offers to follow again
+        function followShown() {
+            for (var btn of document.querySelectorAll('header button')) {
+                var text = btn.textContent.trim();
+                if (text === 'Follow' || text === 'Follow Back') return true;
+            }
+            return false;
+        }
+
+        return {
+            findFollowing(prefer) { return find(followingMethods, null, prefer); },
+            findUnfollow(dialog, prefer) { return find(unfollowMethods, dialog, prefer); },
+            followShown: followShown
+        };
+    })();
+"""
+
+# Outcome of a profile navigation in one evaluation: 'profile', 'login'
+# (redirected to sign in), 'missing' (deleted account), or null while loading
+_PROFILE_STATE_JS = """
+(function() {
+    if (document.readyState !== 'complete') return null;
+    if (document.querySelector('header section')) return 'profile';
+    if (location.pathname.startsWith('/accounts/login')) return 'login';
+    if (document.title.toLowerCase().includes('page not found')) return 'missing';
+    return null;
+})()
+"""
+
+# Clicks Following, then Unfollow once the menu dialog renders it, and
+# resolves once the dialog has closed and the profile shows Follow again, so
+# leaving the page cannot cancel the request. Format with the timeout in
+# milliseconds and a JSON object of preferred finder methods.
+_UNFOLLOW_JS = """
+(function(timeoutMs, prefer) {
+    return new Promise(function(done) {
+        var finished = false;
+
+        function finish(value) {
+            if (finished) return;
+            finished = true;
+            done(value);
+        }
+
+        var following = window.__igBot.findFollowing(prefer.following);
+        if (!following) {
+            return finish({success: false, stage: 'following', error: 'Following button not found'});
+        }
+        following.el.click();
+
+        var confirmed = null;
+
+        function tryConfirm() {
+            if (!confirmed) {
+                var dialog = document.querySelector('[role="dialog"]');
+                var hit = dialog && window.__igBot.findUnfollow(dialog, prefer.unfollow);
+                if (!hit) return false;
+                hit.el.click();
+                confirmed = hit;
+            }
+            if (document.querySelector('[role="dialog"]') || !window.__igBot.followShown()) {
+                return false;
+            }
+            finish({
+                success: true,
+                stage: 'verify',
+                method: following.method + ' / ' + confirmed.method,
+                methods: {following: following.method, unfollow: confirmed.method}
+            });
+            return true;
+        }
+
+        if (tryConfirm()) return;
+
+        var observer = new MutationObserver(function() {
+            if (tryConfirm()) {
+                observer.disconnect();
+                clearTimeout(timer);
+            }
+        });
+        observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+
+        var timer = setTimeout(function() {
+            observer.disconnect();
+            if (confirmed) {
+                return finish({
+                    success: false,
+                    stage: 'verify',
+                    error: 'Profile did not switch back to Follow'
+                });
+            }
+            var dialog = document.querySelector('[role="dialog"]');
+            var texts = [];
+            if (dialog) {
+                dialog.querySelectorAll('span').forEach(function(s) {
+                    var t = s.textContent.trim();
+                    if (t && t.length < 50) texts.push(t);
+                });
+            }
+            finish({
+                success: false,
+                stage: 'confirm',
+                error: dialog ? 'Unfollow not found' : 'No dialog found',
+                dialogTexts: texts.slice(0, 20)
+            });
+        }, timeoutMs);
+    });
+})(%d, %s)
+"""
+
+
 @dataclass
 class UnfollowResult:
     """Result summary of an unfollow execution run."""
@@ -33,6 +220,55 @@ class UnfollowResult:
     dry_run: bool = False
 
 
+class TokenBucket:
+    """Thread-safe token bucket for a rate limit shared across workers."""
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum tokens held, i.e. the largest burst.
+            clock: Monotonic time source, in seconds.
+            sleep: Function used to wait for the next token.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """Take one token, blocking until one is available.
+        
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
 class UnfollowExecutor:
     """Handles automated unfollow actions with skip list filtering.
     
@@ -42,6 +278,20 @@ class UnfollowExecutor:
     
     PROFILE_URL_TEMPLATE = "https://www.instagram.com/{username}/"
     
+    # Locators, built once rather than on every call
+    DIALOG_LOCATOR = (By.CSS_SELECTOR, "div[role='dialog']")
+    # Every branch is scoped to the dialog so no page-level control can come
+    # first. Union results come in document order, so for a given icon its
+    # button wrapper precedes the icon's parent, which precedes the icon
+    CLOSE_BUTTON_LOCATOR = (By.XPATH, (
+        "//div[@role='dialog']//svg[@aria-label='Close']/ancestor::div[@role='button']"
+        " | //div[@role='dialog']//svg[@aria-label='Close']/.."
+        " | //div[@role='dialog']//*[@aria-label='Close']"
+    ))
+    
+    # Successful unfollows buffered before history is rewritten
+    HISTORY_FLUSH_INTERVAL = 10
+    
     def __init__(
         self,
         browser: BrowserManager,
@@ -49,6 +299,7 @@ class UnfollowExecutor:
         dry_run: bool = False,
         config: Config | None = None,
         history_manager: HistoryManager | None = None,
+        n_workers: int = 1,
     ):
         """Initialize with browser, skip list, and dry run flag.
         
@@ -58,265 +309,277 @@ class UnfollowExecutor:
             dry_run: If True, simulate actions without executing.
             config: Configuration object. If None, loads from default.
             history_manager: HistoryManager for tracking unfollows.
+            n_workers: Number of concurrent browser sessions. Extra sessions
+                are started with this browser's login cookies.
         """
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+        
         self.browser = browser
         self.skip_list = skip_list
         self.dry_run = dry_run
         self.config = config or ConfigManager().load()
         self.history_manager = history_manager or HistoryManager()
+        self.n_workers = n_workers
+        # Seeded from config so delay sequences can be replayed
+        self._rng = random.Random(self.config.rng_seed)
+        # Global unfollow rate cap, shared by every worker of this executor
+        self._rate_limiter: TokenBucket | None = None
+        if (self.config.max_unfollows_per_hour or 0) > 0:
+            self._rate_limiter = TokenBucket(self.config.max_unfollows_per_hour / 3600)
+        # WebDriverWait objects by timeout, valid for _waits_driver only
+        self._waits: dict[float, WebDriverWait] = {}
+        self._waits_driver = None
+        # Last username whose profile turned out deleted or login-gated
+        self._unavailable_profile: str | None = None
+        # Finder methods that last worked, tried first on the next profile
+        self._preferred_methods: dict[str, str] = {}
 
-    def _random_delay(self) -> float:
+    def _draw_delay(self) -> float:
+        """Draw the next delay between actions from the configured bounds."""
+        return self._rng.uniform(
+            self.config.action_delay_min,
+            self.config.action_delay_max
+        )
+
+    def _random_delay(self, during: Callable[[], None] | None = None) -> float:
         """Wait a random delay between actions within configured bounds.
         
         The delay is between action_delay_min and action_delay_max seconds
         (default 3-10 seconds) to mimic human behavior and avoid rate limiting.
         
+        Args:
+            during: Optional work (e.g. a history write) to run inside the
+                delay; only the remaining time is slept afterwards.
+            
         Returns:
             The actual delay time in seconds.
         """
-        delay = random.uniform(
-            self.config.action_delay_min,
-            self.config.action_delay_max
-        )
-        time.sleep(delay)
+        delay = self._draw_delay()
+        deadline = time.monotonic() + delay
+        if during is not None:
+            during()
+        time.sleep(max(0.0, deadline - time.monotonic()))
         return delay
     
     def _dismiss_any_modal(self) -> None:
         """Dismiss any open modal/dialog that might be blocking clicks."""
-        if self.browser.driver is None:
+        driver = self.browser.driver
+        if driver is None:
+            return
+        
+        # Nothing to do on a clean page; no keystrokes or waits
+        if not driver.find_elements(*self.DIALOG_LOCATOR):
             return
         
         try:
-            # Try to close any open dialog by pressing Escape
-            body = self.browser.driver.find_element(By.TAG_NAME, "body")
-            body.send_keys(Keys.ESCAPE)
-            time.sleep(0.5)
+            # Try to close any open dialog by pressing Escape; CDP sends the
+            # key to the page directly, without looking up an element first
+            for event_type in ("keyDown", "keyUp"):
+                driver.execute_cdp_cmd("Input.dispatchKeyEvent", {
+                    "type": event_type,
+                    "key": "Escape",
+                    "code": "Escape",
+                    "windowsVirtualKeyCode": 27,
+                })
+            if self._wait_for_dialog_gone():
+                return
         except WebDriverException:
             pass
         
         try:
-            # Try clicking the close button if a dialog is open
-            close_selectors = [
-                (By.XPATH, "//div[@role='dialog']//svg[@aria-label='Close']/ancestor::div[@role='button']"),
-                (By.XPATH, "//svg[@aria-label='Close']/.."),
-                (By.CSS_SELECTOR, "[aria-label='Close']"),
-            ]
-            for selector in close_selectors:
-                try:
-                    close_btn = self.browser.driver.find_element(*selector)
-                    self.browser.driver.execute_script("arguments[0].click();", close_btn)
-                    time.sleep(0.5)
-                    return
-                except NoSuchElementException:
-                    continue
+            # Try clicking the close button if a dialog is open; one lookup
+            # covers every fallback
+            close_buttons = driver.find_elements(*self.CLOSE_BUTTON_LOCATOR)
+            if close_buttons:
+                driver.execute_script("arguments[0].click();", close_buttons[0])
+                self._wait_for_dialog_gone()
         except WebDriverException:
             pass
 
-    def _click_following_button(self) -> bool:
-        """Click the 'Following' button on a user's profile page.
+    def _wait_for_dialog_gone(self, timeout: float = 2.0) -> bool:
+        """Wait until no dialog is visible on the page.
         
+        Args:
+            timeout: Maximum seconds to wait.
+            
         Returns:
-            True if button was clicked successfully, False otherwise.
+            True if the dialog went away, False on timeout.
         """
-        if self.browser.driver is None:
-            return False
-        
         try:
-            # First, dismiss any modal that might be blocking
-            self._dismiss_any_modal()
-            
-            # Use JavaScript to find and click the Following button - most reliable
-            result = self.browser.driver.execute_script(
-                """
-                // Method 1: Find button with "Following" text in header
-                var headerButtons = document.querySelectorAll('header button');
-                for (var btn of headerButtons) {
-                    if (btn.textContent.trim() === 'Following') {
-                        btn.click();
-                        return {success: true, method: 'header button text'};
-                    }
-                }
-                
-                // Method 2: Find button containing div with "Following" text
-                var allButtons = document.querySelectorAll('button');
-                for (var btn of allButtons) {
-                    var divs = btn.querySelectorAll('div');
-                    for (var div of divs) {
-                        if (div.textContent.trim() === 'Following') {
-                            btn.click();
-                            return {success: true, method: 'button>div text'};
-                        }
-                    }
-                }
-                
-                // Method 3: Look for the specific button class pattern
-                var followingBtns = document.querySelectorAll('button[class*="_aswp"]');
-                for (var btn of followingBtns) {
-                    if (btn.textContent.includes('Following')) {
-                        btn.click();
-                        return {success: true, method: 'class _aswp'};
-                    }
-                }
-                
-                return {success: false, error: 'Following button not found'};
-                """
+            self._wait(timeout).until(
+                EC.invisibility_of_element_located(self.DIALOG_LOCATOR)
             )
-            
-            if result and result.get('success'):
-                logger.info(f"Clicked Following button ({result.get('method')})")
-                return True
-            else:
-                logger.warning(f"Could not find Following button: {result.get('error') if result else 'No result'}")
-                return False
-            
-        except WebDriverException as e:
-            logger.error(f"Error clicking Following button: {e}")
+            return True
+        except TimeoutException:
             return False
-    
-    def _confirm_unfollow(self) -> bool:
-        """Confirm unfollow action in the popup dialog/menu.
+
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Return a 0.1s-polling WebDriverWait for the current driver.
+        
+        Waits are reused across calls and rebuilt if the driver changes.
+        
+        Args:
+            timeout: Maximum seconds the wait polls for.
+            
+        Returns:
+            WebDriverWait bound to the current driver.
+        """
+        driver = self.browser.driver
+        if self._waits_driver is not driver:
+            self._waits = {}
+            self._waits_driver = driver
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(driver, timeout, poll_frequency=0.1)
+        return wait
+
+    def _install_page_helpers(self) -> bool:
+        """Register the page helpers to run on every new document.
         
-        Instagram shows a menu modal with options like "Add to close friends",
-        "Mute", "Restrict", and "Unfollow". We need to find and click the
-        Unfollow option in this menu.
+        The registration is tracked on the browser, so executors sharing a
+        driver session install the helpers once between them and navigating
+        between profiles never costs an extra round trip. Only pages loaded
+        afterwards get the helpers, so call before navigating.
         
         Returns:
-            True if unfollow was confirmed successfully, False otherwise.
+            True if the helpers are registered, False if CDP is unavailable.
         """
         if self.browser.driver is None:
             return False
+        return self.browser.add_page_script(_PAGE_HELPERS_NAME, _PAGE_HELPERS_JS)
+
+    def _evaluate(self, expression: str, await_promise: bool = False) -> Any:
+        """Evaluate a JS expression through CDP Runtime.evaluate.
+        
+        Skips the WebDriver script command wrapping and argument
+        serialization of execute_script.
+        
+        Args:
+            expression: JS expression whose value is returned
+            await_promise: Wait for a returned Promise and use its value
+            
+        Returns:
+            The JSON-compatible result value, or None if the script threw
+        """
+        response = self.browser.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "awaitPromise": await_promise,
+            "returnByValue": True,
+        })
+        if "exceptionDetails" in response:
+            logger.debug("Runtime.evaluate failed: %s", response['exceptionDetails'].get('text'))
+            return None
+        return response.get("result", {}).get("value")
+
+    def _unfollow_on_profile_page(self, timeout: float | None = None) -> bool:
+        """Click 'Following' and confirm 'Unfollow' in one browser round trip.
+        
+        The script clicks the Following button, then watches the page with
+        a MutationObserver and clicks Unfollow as soon as Instagram's menu
+        dialog (with options like "Mute", "Restrict", and "Unfollow") shows
+        it, rather than sleeping a fixed time first. It keeps watching until
+        the dialog has closed and the profile button reads Follow again, so
+        callers may navigate away as soon as it returns True.
+        
+        Args:
+            timeout: Seconds to wait for the unfollow to take effect;
+                defaults to the configured element timeout.
+            
+        Returns:
+            True if the unfollow took effect, False otherwise.
+        """
+        driver = self.browser.driver
+        if driver is None:
+            return False
         
         try:
-            # Wait for the dialog/menu to appear
-            time.sleep(1.5)
+            # First, dismiss any modal that might be blocking
+            self._dismiss_any_modal()
             
-            # First check if dialog exists
-            try:
-                dialog = self.browser.driver.find_element(By.XPATH, "//div[@role='dialog']")
-                logger.debug(f"Dialog found, searching for Unfollow option...")
-            except NoSuchElementException:
-                logger.warning("No dialog found after clicking Following button")
-                return False
+            if timeout is None:
+                timeout = self.config.element_timeout
+            script = _UNFOLLOW_JS % (timeout * 1000, json.dumps(self._preferred_methods))
+            if not self.browser.has_page_script(_PAGE_HELPERS_NAME):
+                script = _PAGE_HELPERS_JS + script
             
-            # Use JavaScript to find and click the Unfollow option
-            # This is the most reliable method based on the HTML structure
-            result = self.browser.driver.execute_script(
-                """
-                // Find the dialog
-                var dialog = document.querySelector('[role="dialog"]');
-                if (!dialog) {
-                    console.log('No dialog found');
-                    return {success: false, error: 'No dialog found'};
-                }
-                
-                // Method 1: Find all clickable elements and look for Unfollow text
-                var buttons = dialog.querySelectorAll('[role="button"]');
-                console.log('Found ' + buttons.length + ' buttons in dialog');
-                
-                for (var btn of buttons) {
-                    var text = btn.textContent.trim();
-                    if (text === 'Unfollow') {
-                        console.log('Found Unfollow button, clicking...');
-                        btn.click();
-                        return {success: true, method: 'role=button direct'};
-                    }
-                }
-                
-                // Method 2: Find spans with Unfollow text
-                var spans = dialog.querySelectorAll('span');
-                for (var span of spans) {
-                    if (span.textContent.trim() === 'Unfollow') {
-                        console.log('Found Unfollow span, finding clickable parent...');
-                        var clickable = span.closest('[role="button"]') || span.closest('button');
-                        if (clickable) {
-                            clickable.click();
-                            return {success: true, method: 'span parent'};
-                        } else {
-                            // Click the span itself
-                            span.click();
-                            return {success: true, method: 'span direct'};
-                        }
-                    }
-                }
-                
-                // Method 3: Use TreeWalker to find text nodes
-                var walker = document.createTreeWalker(
-                    dialog,
-                    NodeFilter.SHOW_TEXT,
-                    null,
-                    false
-                );
-                
-                while (walker.nextNode()) {
-                    if (walker.currentNode.textContent.trim() === 'Unfollow') {
-                        var el = walker.currentNode.parentElement;
-                        var clickable = el.closest('[role="button"]') || el.closest('button') || el;
-                        clickable.click();
-                        return {success: true, method: 'treewalker'};
-                    }
-                }
-                
-                // Debug: list all text content in dialog
-                var allText = [];
-                var allSpans = dialog.querySelectorAll('span');
-                allSpans.forEach(function(s) {
-                    var t = s.textContent.trim();
-                    if (t && t.length < 50) allText.push(t);
-                });
-                
-                return {success: false, error: 'Unfollow not found', dialogTexts: allText.slice(0, 20)};
-                """
-            )
+            result = self._evaluate(script, await_promise=True)
             
             if result and result.get('success'):
-                logger.info(f"Clicked Unfollow via JS ({result.get('method')})")
-                time.sleep(0.5)
+                logger.info("Unfollowed via JS (%s)", result.get('method'))
+                self._preferred_methods = result.get('methods') or {}
                 return True
-            else:
-                error = result.get('error', 'Unknown') if result else 'No result'
-                texts = result.get('dialogTexts', []) if result else []
-                logger.warning(f"Could not find Unfollow: {error}")
-                if texts:
-                    logger.debug(f"Dialog contains: {texts[:10]}")
-                return False
+            
+            error = result.get('error', 'Unknown') if result else 'No result'
+            stage = result.get('stage', '?') if result else '?'
+            texts = result.get('dialogTexts', []) if result else []
+            logger.warning("Unfollow failed at %s stage: %s", stage, error)
+            if texts:
+                logger.debug("Dialog contains: %s", texts[:10])
+            return False
             
         except WebDriverException as e:
-            logger.error(f"Error confirming unfollow: {e}")
+            logger.error("Error unfollowing on profile page: %s", e)
             return False
 
-    def _navigate_to_profile(self, username: str) -> bool:
+    def _navigate_to_profile(self, username: str, timeout: float = 10) -> bool:
         """Navigate to a user's profile page.
         
         Args:
             username: Instagram username to navigate to.
+            timeout: Maximum seconds to wait for the profile header.
             
         Returns:
             True if navigation successful, False otherwise.
         """
-        if self.browser.driver is None:
+        driver = self.browser.driver
+        if driver is None:
             return False
         
         try:
             profile_url = self.PROFILE_URL_TEMPLATE.format(username=username)
-            self.browser.driver.get(profile_url)
-            time.sleep(2)  # Allow page to load
+            self._install_page_helpers()
+            driver.get(profile_url)
             
-            # Verify we're on the profile page
-            # Check for profile-specific elements
+            # Verify we're on the profile page, or stop as soon as Instagram
+            # shows a login redirect or its not-found page instead
             try:
-                WebDriverWait(self.browser.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "header section"))
-                )
-                return True
+                state = self._wait(timeout).until(self._profile_load_state)
             except TimeoutException:
-                logger.warning(f"Profile page for {username} did not load properly")
+                logger.warning("Profile page for %s did not load properly", username)
+                return False
+            
+            if state != "profile":
+                logger.warning("Profile %s unavailable (%s)", username, state)
+                self._unavailable_profile = username
                 return False
+            return True
                 
         except WebDriverException as e:
-            logger.error(f"Error navigating to profile {username}: {e}")
+            logger.error("Error navigating to profile %s: %s", username, e)
+            return False
+    
+    def _profile_load_state(self, driver) -> str | bool:
+        """WebDriverWait condition for a profile navigation.
+        
+        Readiness, header, login redirect and not-found title are all
+        checked in a single CDP evaluation per poll. The evaluation can fail
+        while the old document is torn down mid-navigation; that counts as
+        still loading so the wait keeps polling.
+        
+        Args:
+            driver: The WebDriver being polled.
+            
+        Returns:
+            "profile", "login" or "missing" once the outcome is known,
+            False while the page is still loading.
+        """
+        try:
+            return self._evaluate(_PROFILE_STATE_JS) or False
+        except WebDriverException:
             return False
     
-    def unfollow_user(self, username: str) -> bool:
+    def unfollow_user(self, username: str, preloaded: bool = False) -> bool:
         """Navigate to user profile and execute unfollow action.
         
         In dry run mode, simulates the action without executing.
@@ -324,126 +587,450 @@ class UnfollowExecutor:
         
         Args:
             username: Instagram username to unfollow.
+            preloaded: True if the browser is already on this user's profile;
+                skips the first navigation.
             
         Returns:
             True if unfollow was successful (or simulated in dry run),
             False otherwise.
         """
-        logger.info(f"{'[DRY RUN] ' if self.dry_run else ''}Processing unfollow for: {username}")
+        logger.info("%sProcessing unfollow for: %s", "[DRY RUN] " if self.dry_run else "", username)
         
         if self.dry_run:
             # Simulate the action - log what would happen
-            logger.info(f"[DRY RUN] Would navigate to {username}'s profile")
-            logger.info(f"[DRY RUN] Would click Following button")
-            logger.info(f"[DRY RUN] Would confirm unfollow")
+            logger.info("[DRY RUN] Would navigate to %s's profile", username)
+            logger.info("[DRY RUN] Would click Following button")
+            logger.info("[DRY RUN] Would confirm unfollow")
             return True
         
-        # Use retry logic for the actual unfollow operation
+        # Use retry logic for the actual unfollow operation, with every
+        # attempt's waits and backoff drawn from one time budget
         max_retries = self.config.max_retries
+        deadline = time.monotonic() + self.config.unfollow_budget
         
         for attempt in range(max_retries):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Giving up on %s: %.0fs budget spent", username, self.config.unfollow_budget)
+                return False
+            
             try:
-                # Navigate to user's profile
-                if not self._navigate_to_profile(username):
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Retry {attempt + 1}/{max_retries} for {username}")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    return False
-                
-                # Click the Following button
-                if not self._click_following_button():
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Retry {attempt + 1}/{max_retries} for {username}")
-                        time.sleep(2 ** attempt)
+                # Navigate to user's profile (unless the caller already did);
+                # whole-second timeouts keep the set of cached waits small
+                navigated = preloaded and attempt == 0
+                if not navigated and not self._navigate_to_profile(
+                    username, timeout=min(10, math.ceil(remaining))
+                ):
+                    if attempt < max_retries - 1 and self._unavailable_profile != username:
+                        logger.warning("Retry %d/%d for %s", attempt + 1, max_retries, username)
+                        time.sleep(self._backoff_delay(attempt, deadline))
                         continue
                     return False
                 
-                time.sleep(1)  # Wait for dialog to appear
-                
-                # Confirm the unfollow action
-                if not self._confirm_unfollow():
+                # Click Following and confirm Unfollow in one round trip
+                confirm_timeout = max(0.5, min(self.config.element_timeout, deadline - time.monotonic()))
+                if not self._unfollow_on_profile_page(confirm_timeout):
                     if attempt < max_retries - 1:
-                        logger.warning(f"Retry {attempt + 1}/{max_retries} for {username}")
-                        time.sleep(2 ** attempt)
+                        logger.warning("Retry %d/%d for %s", attempt + 1, max_retries, username)
+                        time.sleep(self._backoff_delay(attempt, deadline))
                         continue
                     return False
                 
-                logger.info(f"Successfully unfollowed: {username}")
+                logger.info("Successfully unfollowed: %s", username)
                 return True
                 
             except WebDriverException as e:
-                logger.error(f"Error unfollowing {username}: {e}")
+                logger.error("Error unfollowing %s: %s", username, e)
                 if attempt < max_retries - 1:
-                    logger.warning(f"Retry {attempt + 1}/{max_retries} for {username}")
-                    time.sleep(2 ** attempt)
+                    logger.warning("Retry %d/%d for %s", attempt + 1, max_retries, username)
+                    time.sleep(self._backoff_delay(attempt, deadline))
                     continue
                 return False
         
         return False
 
-    def execute(self, targets: list[str], max_unfollows: int = 50) -> UnfollowResult:
-        """Execute unfollows on target list up to max limit.
+    def _throttle(self) -> None:
+        """Block until the configured hourly unfollow cap allows another attempt."""
+        if self._rate_limiter is None or self.dry_run:
+            return
+        waited = self._rate_limiter.acquire()
+        if waited > 0:
+            logger.info("Hourly unfollow cap: waited %.0fs", waited)
+
+    def _backoff_delay(self, attempt: int, deadline: float) -> float:
+        """Capped, jittered exponential backoff, never past the deadline.
         
-        Filters targets through skip list and history before processing.
-        Records successful unfollows to history (unless in dry run mode).
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+            deadline: time.monotonic() value the retries must finish by.
+            
+        Returns:
+            Seconds to sleep before the next attempt.
+        """
+        backoff = min(self.config.max_backoff, 2 ** attempt) + self._rng.uniform(0, 1)
+        return max(0.0, min(backoff, deadline - time.monotonic()))
+
+    def _record_outcome(
+        self,
+        username: str,
+        success: bool,
+        result: UnfollowResult,
+        pending_history: list[str],
+    ) -> None:
+        """Record one attempt in the result and the buffered history.
         
         Args:
-            targets: List of usernames to potentially unfollow.
-            max_unfollows: Maximum number of unfollow actions to perform.
+            username: Username that was attempted.
+            success: Whether the unfollow took effect.
+            result: Result object updated in place.
+            pending_history: Successful unfollows not yet written to history.
+        """
+        if not success:
+            result.failed.append(username)
+            logger.warning("Failed to unfollow: %s", username)
+            return
+        
+        result.successful.append(username)
+        # Record to history (only if not dry run)
+        if not self.dry_run:
+            pending_history.append(username)
+
+    def _flush_history(self, pending_history: list[str]) -> None:
+        """Write buffered unfollows to history with a single append."""
+        if pending_history:
+            self.history_manager.record_unfollows(pending_history)
+            pending_history.clear()
+
+    def _due_flush(
+        self,
+        more_to_do: bool,
+        pending_history: list[str],
+    ) -> Callable[[], None] | None:
+        """Schedule the history write after a successful unfollow, if due.
+        
+        A due write is done inside the delay before the next unfollow
+        instead of before it, or right away if no delay follows.
+        
+        Args:
+            more_to_do: Whether a delay and another unfollow follow.
+            pending_history: Successful unfollows not yet written to history.
             
         Returns:
-            UnfollowResult with successful, skipped, and failed lists.
+            The write to run during the delay, or None.
+        """
+        if len(pending_history) < self.HISTORY_FLUSH_INTERVAL:
+            return None
+        if not more_to_do:
+            self._flush_history(pending_history)
+            return None
+        return lambda: self._flush_history(pending_history)
+
+    def _execute_serial(
+        self,
+        candidates: list[str],
+        max_unfollows: int,
+        result: UnfollowResult,
+    ) -> None:
+        """Process candidates one at a time in this executor's browser.
+        
+        Failed attempts do not count towards max_unfollows, so the limit is
+        checked per success rather than by slicing candidates.
+        
+        Args:
+            candidates: Filtered usernames to unfollow, in order.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            result: Result object updated in place.
         """
-        result = UnfollowResult(dry_run=self.dry_run)
         processed_count = 0
+        pending_history: list[str] = []
+        
+        try:
+            for i, username in enumerate(candidates):
+                # Check if we've reached the max unfollows limit
+                if processed_count >= max_unfollows:
+                    logger.info("Reached max unfollows limit (%d)", max_unfollows)
+                    break
+                
+                self._throttle()
+                success = self.unfollow_user(username)
+                self._record_outcome(username, success, result, pending_history)
+                if not success:
+                    continue
+                processed_count += 1
+                
+                more_to_do = processed_count < max_unfollows and i + 1 < len(candidates)
+                flush = self._due_flush(more_to_do, pending_history)
+                if more_to_do:
+                    delay = self._random_delay(flush)
+                    logger.debug("Waited %.1fs before next action", delay)
+        finally:
+            # Checkpoint whatever is left, even if the run is interrupted
+            self._flush_history(pending_history)
+
+    async def _execute_serial_async(
+        self,
+        candidates: list[str],
+        max_unfollows: int,
+        result: UnfollowResult,
+    ) -> None:
+        """Async counterpart of _execute_serial.
         
-        logger.info(f"Starting unfollow execution (dry_run={self.dry_run}, max={max_unfollows})")
-        logger.info(f"Total targets: {len(targets)}, Skip list size: {len(self.skip_list)}")
+        Driver calls run in a worker thread and the delay between actions
+        is an asyncio.sleep, during which the next profile is already
+        loaded and any due history write happens. The unfollow has taken
+        effect by the time unfollow_user returns True, so leaving the page
+        for the next profile cannot cancel it.
         
-        for username in targets:
-            # Check if we've reached the max unfollows limit
-            if processed_count >= max_unfollows:
-                logger.info(f"Reached max unfollows limit ({max_unfollows})")
-                break
-            
-            # Filter: Skip if in skip list
-            if username in self.skip_list:
-                logger.info(f"Skipping {username}: in skip list")
-                result.skipped.append(username)
-                continue
+        Args:
+            candidates: Filtered usernames to unfollow, in order.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            result: Result object updated in place.
+        """
+        processed_count = 0
+        pending_history: list[str] = []
+        preloaded: str | None = None
+        
+        try:
+            for i, username in enumerate(candidates):
+                if processed_count >= max_unfollows:
+                    logger.info("Reached max unfollows limit (%d)", max_unfollows)
+                    break
+                
+                await asyncio.to_thread(self._throttle)
+                success = await asyncio.to_thread(
+                    self.unfollow_user, username, preloaded == username
+                )
+                preloaded = None
+                self._record_outcome(username, success, result, pending_history)
+                if not success:
+                    continue
+                processed_count += 1
+                
+                more_to_do = processed_count < max_unfollows and i + 1 < len(candidates)
+                flush = self._due_flush(more_to_do, pending_history)
+                if not more_to_do:
+                    continue
+                
+                delay = self._draw_delay()
+                next_username = candidates[i + 1]
+                pending = [asyncio.sleep(delay)]
+                if flush is not None:
+                    pending.append(asyncio.to_thread(flush))
+                if not self.dry_run:
+                    pending.append(asyncio.to_thread(self._navigate_to_profile, next_username))
+                done = await asyncio.gather(*pending)
+                if not self.dry_run and done[-1]:
+                    preloaded = next_username
+                logger.debug("Waited %.1fs before next action", delay)
+        finally:
+            self._flush_history(pending_history)
+
+    def _partition_targets(
+        self,
+        targets: list[str],
+        result: UnfollowResult,
+        blocked: set[str],
+    ) -> list[str]:
+        """Split targets into candidates and skips up front.
+        
+        Repeated usernames are dropped first, keeping their first position.
+        Skipped usernames are logged and appended to result.skipped.
+        
+        Args:
+            targets: Usernames to potentially unfollow, in order.
+            result: Result object updated in place.
+            blocked: Usernames to skip.
             
-            # Filter: Skip if previously unfollowed
-            if self.history_manager.was_unfollowed(username):
-                logger.info(f"Skipping {username}: previously unfollowed")
+        Returns:
+            Usernames to attempt, in target order.
+        """
+        candidates = []
+        for username in dict.fromkeys(targets):
+            if username in blocked:
+                reason = "in skip list" if username in self.skip_list else "previously unfollowed"
+                logger.info("Skipping %s: %s", username, reason)
                 result.skipped.append(username)
                 continue
-            
-            # Execute unfollow
-            success = self.unfollow_user(username)
-            
-            if success:
-                result.successful.append(username)
-                processed_count += 1
+            candidates.append(username)
+        return candidates
+
+    def _execute_parallel(
+        self,
+        candidates: list[str],
+        max_unfollows: int,
+        result: UnfollowResult,
+    ) -> None:
+        """Process targets across n_workers browser sessions.
+        
+        One WebDriver session can only drive one window at a time, so each
+        worker gets its own browser: this executor's, plus ephemeral ones
+        that copy its login cookies. Every worker keeps its own random delay
+        between actions, seeded with rng_seed plus its index when a seed is
+        configured, and workers start staggered by one delay each.
+        
+        Args:
+            candidates: Filtered usernames to unfollow.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            result: Result object updated in place.
+        """
+        work: queue.Queue[str] = queue.Queue()
+        for username in candidates:
+            work.put(username)
+        
+        lock = threading.Lock()
+        slots = [max_unfollows]  # Remaining unfollows, claimed before each attempt
+        pending_history: list[str] = []
+        
+        def run(index: int, browser: BrowserManager) -> None:
+            worker = UnfollowExecutor(
+                browser,
+                self.skip_list,
+                config=self.config,
+                history_manager=self.history_manager,
+            )
+            if self.config.rng_seed is not None:
+                # Same seed everywhere would make workers act in lockstep
+                worker._rng.seed(self.config.rng_seed + index)
+            while True:
+                with lock:
+                    if slots[0] <= 0:
+                        return
+                    try:
+                        username = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    slots[0] -= 1
                 
-                # Record to history (only if not dry run)
-                if not self.dry_run:
-                    self.history_manager.record_unfollow(username)
+                try:
+                    self._throttle()
+                    success = worker.unfollow_user(username)
+                except Exception:
+                    # Keep the worker alive; the slot goes back below
+                    logger.exception("Unexpected error unfollowing %s", username)
+                    success = False
+                
+                with lock:
+                    if success:
+                        result.successful.append(username)
+                        pending_history.append(username)
+                        if len(pending_history) >= self.HISTORY_FLUSH_INTERVAL:
+                            self.history_manager.record_unfollows(pending_history)
+                            pending_history.clear()
+                    else:
+                        slots[0] += 1  # A failure does not use up the limit
+                        result.failed.append(username)
+                        logger.warning("Failed to unfollow: %s", username)
                 
-                # Add random delay between actions
-                if processed_count < max_unfollows and processed_count < len(targets):
-                    delay = self._random_delay()
-                    logger.debug(f"Waiting {delay:.1f}s before next action")
-            else:
-                result.failed.append(username)
-                logger.warning(f"Failed to unfollow: {username}")
-        
-        # Log summary
+                if success:
+                    worker._random_delay()
+        
+        browsers = [self.browser]
+        try:
+            for _ in range(self.n_workers - 1):
+                extra = BrowserManager(config=self.config, ephemeral=True)
+                browsers.append(extra)
+                extra.start()
+                extra.copy_session_from(self.browser)
+            
+            threads = [
+                threading.Thread(target=run, args=(i, b), daemon=True)
+                for i, b in enumerate(browsers)
+            ]
+            for i, thread in enumerate(threads):
+                if i:
+                    self._random_delay()
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            if pending_history:
+                self.history_manager.record_unfollows(pending_history)
+            for extra in browsers[1:]:
+                extra.close()
+
+    def _start_run(self, targets: list[str], max_unfollows: int) -> tuple[UnfollowResult, list[str]]:
+        """Create the run's result and filter targets into candidates.
+        
+        Args:
+            targets: List of usernames to potentially unfollow.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            
+        Returns:
+            The empty result (skips already recorded) and the candidates.
+        """
+        result = UnfollowResult(dry_run=self.dry_run)
+        
+        logger.info("Starting unfollow execution (dry_run=%s, max=%d)", self.dry_run, max_unfollows)
+        logger.info("Total targets: %d, Skip list size: %d", len(targets), len(self.skip_list))
+        
+        # Skip list and history merged once so each target costs one lookup
+        blocked = set(self.skip_list)
+        blocked.update(self.history_manager.iter_unfollowed())
+        
+        candidates = self._partition_targets(targets, result, blocked)
+        if not candidates:
+            logger.info("No targets left after skip list and history filtering")
+        return result, candidates
+
+    def _log_summary(self, result: UnfollowResult) -> None:
+        """Log the totals of a finished run."""
         logger.info(
-            f"Unfollow execution complete: "
-            f"{len(result.successful)} successful, "
-            f"{len(result.skipped)} skipped, "
-            f"{len(result.failed)} failed"
+            "Unfollow execution complete: %d successful, %d skipped, %d failed",
+            len(result.successful),
+            len(result.skipped),
+            len(result.failed),
         )
+
+    async def execute_async(self, targets: list[str], max_unfollows: int = 50) -> UnfollowResult:
+        """Execute unfollows without blocking the running event loop.
+        
+        Same filtering, limit, history handling and n_workers behavior as
+        execute. The caller must keep other users of the browser away until
+        this returns.
+        
+        Args:
+            targets: List of usernames to potentially unfollow.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            
+        Returns:
+            UnfollowResult with successful, skipped, and failed lists.
+        """
+        result, candidates = self._start_run(targets, max_unfollows)
+        if not candidates:
+            self._log_summary(result)
+            return result
+        
+        if self.n_workers > 1 and not self.dry_run:
+            # Workers block on their own threads; keep the loop free meanwhile
+            await asyncio.to_thread(self._execute_parallel, candidates, max_unfollows, result)
+        else:
+            await self._execute_serial_async(candidates, max_unfollows, result)
+        
+        self._log_summary(result)
+        return result
+
+    def execute(self, targets: list[str], max_unfollows: int = 50) -> UnfollowResult:
+        """Execute unfollows on target list up to max limit.
+        
+        Filters targets through skip list and history before processing.
+        Records successful unfollows to history (unless in dry run mode).
+        
+        Args:
+            targets: List of usernames to potentially unfollow.
+            max_unfollows: Maximum number of unfollow actions to perform.
+            
+        Returns:
+            UnfollowResult with successful, skipped, and failed lists.
+        """
+        result, candidates = self._start_run(targets, max_unfollows)
+        if not candidates:
+            self._log_summary(result)
+            return result
+        
+        if self.n_workers > 1 and not self.dry_run:
+            self._execute_parallel(candidates, max_unfollows, result)
+        else:
+            self._execute_serial(candidates, max_unfollows, result)
         
+        self._log_summary(result)
         return result
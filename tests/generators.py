@@ -1,22 +1,29 @@
 """Custom Hypothesis strategies for property-based testing."""
 
+import functools
+
 from hypothesis import strategies as st
 from datetime import datetime, timezone
 
 # Generate valid Instagram usernames (1-30 chars, alphanumeric + underscore + period)
 # Rules: cannot start/end with period, no consecutive periods
-username_strategy = st.text(
-    alphabet=st.sampled_from("abcdefghijklmnopqrstuvwxyz0123456789_."),
-    min_size=1,
-    max_size=30
-).filter(
-    lambda x: (
-        not x.startswith('.') and 
-        not x.endswith('.') and 
-        '..' not in x and
-        len(x) > 0
-    )
-)
+_word_char = st.sampled_from("abcdefghijklmnopqrstuvwxyz0123456789_")
+_any_char = st.sampled_from("abcdefghijklmnopqrstuvwxyz0123456789_.")
+
+
+@st.composite
+def _valid_username(draw) -> str:
+    """Build a valid username char by char, so no draw is ever rejected."""
+    length = draw(st.integers(min_value=1, max_value=30))
+    chars: list[str] = []
+    for i in range(length):
+        # A period may only sit between two non-period characters
+        period_allowed = 0 < i < length - 1 and chars[-1] != '.'
+        chars.append(draw(_any_char if period_allowed else _word_char))
+    return "".join(chars)
+
+
+username_strategy = _valid_username()
 
 # Generate list of unique usernames
 username_list_strategy = st.lists(
@@ -27,17 +34,17 @@ username_list_strategy = st.lists(
 )
 
 # Generate set of unique usernames
-username_set_strategy = st.frozensets(
+username_set_strategy = st.sets(
     username_strategy,
     min_size=0,
     max_size=100
-).map(set)
+)
 
 
 # Generate ISO 8601 timestamps
 def _format_timestamp(dt: datetime) -> str:
     """Format datetime as ISO 8601 with Z suffix."""
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return dt.isoformat(timespec="seconds") + "Z"
 
 
 timestamp_strategy = st.datetimes(
@@ -47,8 +54,12 @@ timestamp_strategy = st.datetimes(
 
 
 # Generate valid Snapshot objects (lazy import to avoid circular deps)
+@functools.lru_cache(maxsize=1)
 def snapshot_strategy():
-    """Strategy for generating valid Snapshot objects."""
+    """Strategy for generating valid Snapshot objects.
+    
+    Built on first call and reused afterwards.
+    """
     from ig_unfollower.snapshot import Snapshot
     
     return st.builds(
@@ -0,0 +1,44 @@
+"""Tests for configuration loading."""
+
+import json
+
+import pytest
+
+from ig_unfollower.config import ConfigManager
+
+
+def load_with(tmp_path, **values):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(values))
+    return ConfigManager(str(path)).load()
+
+
+def test_max_unfollows_per_hour_defaults_to_no_cap(tmp_path):
+    assert load_with(tmp_path).max_unfollows_per_hour is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    (60, 60),
+    ("40", 40),
+    (12.0, 12),
+    (0, None),
+    (-5, None),
+    (None, None),
+])
+def test_max_unfollows_per_hour_is_coerced(tmp_path, value, expected):
+    config = load_with(tmp_path, max_unfollows_per_hour=value)
+    
+    assert config.max_unfollows_per_hour == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (42, 42),
+    ("42", 42),
+    (None, None),
+    ("abc", None),
+    ([1], None),
+])
+def test_rng_seed_is_coerced(tmp_path, value, expected):
+    config = load_with(tmp_path, rng_seed=value)
+    
+    assert config.rng_seed == expected
@@ -0,0 +1,98 @@
+"""Tests for unfollow history storage and legacy migration."""
+
+import json
+
+import pytest
+
+from ig_unfollower import history
+from ig_unfollower.history import HistoryManager
+
+
+@pytest.fixture(params=["json", "orjson"])
+def backend(request, monkeypatch):
+    """Run each test with the stdlib encoder and, if installed, orjson."""
+    if request.param == "json":
+        monkeypatch.setattr(history, "orjson", None)
+    else:
+        monkeypatch.setattr(history, "orjson", pytest.importorskip("orjson"))
+    return request.param
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    return tmp_path / "unfollowed_history.json"
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_round_trip(backend, history_path):
+    manager = HistoryManager(str(history_path))
+    manager.record_unfollows(["alice", "bob"])
+    manager.record_unfollow("zoë")
+    
+    reloaded = HistoryManager(str(history_path)).load()
+    
+    assert reloaded == manager.load()
+    assert list(reloaded) == ["alice", "bob", "zoë"]
+
+
+def test_records_are_appended_one_per_line(backend, history_path):
+    manager = HistoryManager(str(history_path))
+    manager.record_unfollow("alice")
+    manager.record_unfollows(["bob", "carol"])
+    
+    records = read_records(history_path)
+    
+    assert [r["u"] for r in records] == ["alice", "bob", "carol"]
+    assert all(r.keys() == {"u", "t"} for r in records)
+
+
+def test_single_record_is_not_taken_for_legacy(backend, history_path):
+    HistoryManager(str(history_path)).record_unfollow("alice")
+    
+    loaded = HistoryManager(str(history_path)).load()
+    
+    assert list(loaded) == ["alice"]
+
+
+def test_partial_last_line_is_ignored(backend, history_path):
+    HistoryManager(str(history_path)).record_unfollows(["alice", "bob"])
+    with open(history_path, "ab") as f:
+        f.write(b'{"u": "car')
+    
+    assert list(HistoryManager(str(history_path)).load()) == ["alice", "bob"]
+
+
+@pytest.mark.parametrize("legacy", [
+    {"alice": "2024-01-01T00:00:00Z", "bob": "2024-01-02T00:00:00Z"},
+    {"u": "2024-01-01T00:00:00Z", "t": "2024-01-02T00:00:00Z"},
+    {},
+])
+def test_legacy_file_is_migrated(backend, history_path, legacy):
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(legacy, f, indent=2, ensure_ascii=False)
+    
+    loaded = HistoryManager(str(history_path)).load()
+    
+    assert loaded == legacy
+    assert {r["u"]: r["t"] for r in read_records(history_path)} == legacy
+    assert HistoryManager(str(history_path)).load() == legacy
+
+
+def test_migrated_file_accepts_appends(backend, history_path):
+    history_path.write_text(json.dumps({"alice": "2024-01-01T00:00:00Z"}, indent=2))
+    manager = HistoryManager(str(history_path))
+    manager.load()
+    
+    manager.record_unfollow("bob")
+    
+    assert list(HistoryManager(str(history_path)).load()) == ["alice", "bob"]
+
+
+def test_missing_file_is_empty(backend, history_path):
+    manager = HistoryManager(str(history_path))
+    
+    assert manager.load() == {}
+    assert not manager.was_unfollowed("alice")
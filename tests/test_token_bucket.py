@@ -0,0 +1,75 @@
+"""Tests for the shared unfollow rate limit."""
+
+import pytest
+
+from ig_unfollower.unfollower import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the bucket sleeps."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_bucket(rate: float, capacity: float = 1.0) -> tuple[TokenBucket, FakeClock]:
+    clock = FakeClock()
+    return TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep), clock
+
+
+def test_first_acquire_does_not_wait():
+    bucket, clock = make_bucket(rate=1 / 60)
+    
+    assert bucket.acquire() == 0.0
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_next_token():
+    bucket, clock = make_bucket(rate=1 / 60)
+    bucket.acquire()
+    
+    waited = bucket.acquire()
+    
+    assert waited == pytest.approx(60.0)
+    assert clock.now == pytest.approx(60.0)
+
+
+def test_elapsed_time_refills_bucket():
+    bucket, clock = make_bucket(rate=1 / 60)
+    bucket.acquire()
+    clock.now += 45.0
+    
+    assert bucket.acquire() == pytest.approx(15.0)
+
+
+def test_refill_is_capped_at_capacity():
+    bucket, clock = make_bucket(rate=1.0, capacity=2.0)
+    clock.now += 100.0
+    
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_hourly_cap_spaces_out_acquires():
+    bucket, clock = make_bucket(rate=30 / 3600)
+    
+    for _ in range(31):
+        bucket.acquire()
+    
+    # One token up front, then one every 120s
+    assert clock.now == pytest.approx(3600.0)
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        TokenBucket(rate)